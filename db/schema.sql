@@ -27,6 +27,22 @@ create table if not exists contributions (
 );
 create index if not exists ix_contributions_lane on contributions(lane);
 create index if not exists ix_contributions_rate on contributions(rate_category);
+create index if not exists ix_contributions_updated on contributions(updated_at desc nulls last, family_name);
+
+-- ytd is always the sum of the month columns (overwrites any ytd a writer sends)
+create or replace function contributions_set_ytd() returns trigger
+language plpgsql as $$
+begin
+  new.ytd := coalesce(new.jan,0)+coalesce(new.feb,0)+coalesce(new.mar,0)
+           +coalesce(new.apr,0)+coalesce(new.may,0)+coalesce(new.jun,0)
+           +coalesce(new.jul,0)+coalesce(new.aug,0)+coalesce(new.sep,0)
+           +coalesce(new.oct,0)+coalesce(new.nov,0)+coalesce(new.dec,0);
+  return new;
+end
+$$;
+create or replace trigger contributions_set_ytd
+  before insert or update on contributions
+  for each row execute function contributions_set_ytd();
 
 -- ---------- EXPENSES ----------
 create table if not exists expenses (
@@ -42,7 +58,8 @@ create table if not exists expenses (
   receipt text,
   created_at timestamptz not null default now()
 );
-create index if not exists ix_expenses_date on expenses("date");
+drop index if exists ix_expenses_date;  -- superseded by ix_expenses_date_id
+create index if not exists ix_expenses_date_id on expenses("date" desc, id desc);
 create index if not exists ix_expenses_category on expenses(category);
 
 -- ---------- SPECIAL CONTRIBUTIONS ----------
@@ -56,7 +73,8 @@ create table if not exists special (
   remarks text,
   created_at timestamptz not null default now()
 );
-create index if not exists ix_special_date on special("date");
+drop index if exists ix_special_date;  -- superseded by ix_special_date_id
+create index if not exists ix_special_date_id on special("date" desc, id desc);
 create index if not exists ix_special_type on special("type");
 
 -- ---------- REQUESTS ----------
@@ -71,6 +89,7 @@ create table if not exists expense_requests (
   remarks text,
   created_at timestamptz not null default now()
 );
+create index if not exists ix_expense_requests_date on expense_requests("date" desc, id desc);
 
 create table if not exists contribution_requests (
   id bigserial primary key,
@@ -85,6 +104,7 @@ create table if not exists contribution_requests (
   remarks text,
   created_at timestamptz not null default now()
 );
+create index if not exists ix_contribution_requests_date on contribution_requests("date" desc, id desc);
 
 create table if not exists special_requests (
   id bigserial primary key,
@@ -97,6 +117,7 @@ create table if not exists special_requests (
   remarks text,
   created_at timestamptz not null default now()
 );
+create index if not exists ix_special_requests_date on special_requests("date" desc, id desc);
 
 -- ---------- CASH MANAGEMENT (single row) ----------
 create table if not exists cash_management (
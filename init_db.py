@@ -21,6 +21,23 @@ CREATE TABLE IF NOT EXISTS public.contributions (
   remarks       TEXT,
   updated_at    TIMESTAMP DEFAULT NOW()
 );
+CREATE INDEX IF NOT EXISTS idx_contributions_updated_at
+  ON public.contributions (updated_at DESC NULLS LAST, family_name);
+
+-- ytd is always the sum of the month columns (overwrites any ytd a writer sends)
+CREATE OR REPLACE FUNCTION public.contributions_set_ytd() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+  NEW.ytd := COALESCE(NEW.jan,0)+COALESCE(NEW.feb,0)+COALESCE(NEW.mar,0)
+           +COALESCE(NEW.apr,0)+COALESCE(NEW.may,0)+COALESCE(NEW.jun,0)
+           +COALESCE(NEW.jul,0)+COALESCE(NEW.aug,0)+COALESCE(NEW.sep,0)
+           +COALESCE(NEW.oct,0)+COALESCE(NEW.nov,0)+COALESCE(NEW.dec,0);
+  RETURN NEW;
+END
+$$;
+CREATE OR REPLACE TRIGGER contributions_set_ytd
+  BEFORE INSERT OR UPDATE ON public.contributions
+  FOR EACH ROW EXECUTE FUNCTION public.contributions_set_ytd();
 
 -- Approved / rejected requests to update contributions
 CREATE TABLE IF NOT EXISTS public.contribution_requests (
@@ -35,6 +52,8 @@ CREATE TABLE IF NOT EXISTS public.contribution_requests (
   status TEXT NOT NULL DEFAULT 'Pending Approval',
   remarks TEXT
 );
+CREATE INDEX IF NOT EXISTS idx_contribution_requests_date
+  ON public.contribution_requests (date DESC, id DESC);
 
 -- Expenses ledger
 CREATE TABLE IF NOT EXISTS public.expenses (
@@ -48,6 +67,8 @@ CREATE TABLE IF NOT EXISTS public.expenses (
   mode TEXT,
   remarks TEXT
 );
+CREATE INDEX IF NOT EXISTS idx_expenses_date
+  ON public.expenses (date DESC, id DESC);
 
 -- Expense requests (for approval)
 CREATE TABLE IF NOT EXISTS public.expense_requests (
@@ -60,6 +81,8 @@ CREATE TABLE IF NOT EXISTS public.expense_requests (
   status TEXT NOT NULL DEFAULT 'Pending Approval',
   remarks TEXT
 );
+CREATE INDEX IF NOT EXISTS idx_expense_requests_date
+  ON public.expense_requests (date DESC, id DESC);
 
 -- Rate catalog
 CREATE TABLE IF NOT EXISTS public.rates (
@@ -74,6 +97,8 @@ CREATE TABLE IF NOT EXISTS public.cash_management (
   cash_withdrawal NUMERIC(14,2) NOT NULL DEFAULT 0,
   updated_at TIMESTAMP DEFAULT NOW()
 );
+CREATE INDEX IF NOT EXISTS idx_cash_management_updated_at
+  ON public.cash_management (updated_at DESC NULLS LAST);
 
 -- Specials (your write helpers already guard these, but we add here for completeness)
 CREATE TABLE IF NOT EXISTS public.special (
@@ -85,6 +110,8 @@ CREATE TABLE IF NOT EXISTS public.special (
   amount NUMERIC(14,2) NOT NULL DEFAULT 0,
   remarks TEXT
 );
+CREATE INDEX IF NOT EXISTS idx_special_date
+  ON public.special (date DESC, id DESC);
 CREATE TABLE IF NOT EXISTS public.special_requests (
   id SERIAL PRIMARY KEY,
   date DATE NOT NULL,
@@ -95,6 +122,8 @@ CREATE TABLE IF NOT EXISTS public.special_requests (
   status TEXT NOT NULL DEFAULT 'Pending Approval',
   remarks TEXT
 );
+CREATE INDEX IF NOT EXISTS idx_special_requests_date
+  ON public.special_requests (date DESC, id DESC);
 """
 
 SEED = """
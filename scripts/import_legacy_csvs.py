@@ -20,6 +20,11 @@ def f(x):
     except Exception:
         return 0
 
+def f_col(s):
+    """Vectorized f() for a whole column: invalid/blank -> 0."""
+    s = s.astype(str).str.replace(",", "", regex=False).str.strip()
+    return pd.to_numeric(s, errors="coerce").fillna(0.0)
+
 def to_date(s):
     """Coerce to Python date (for DATE columns) or None."""
     try:
@@ -104,17 +109,9 @@ with psycopg2.connect(**dsn) as conn:
         df.columns = [c.strip() for c in df.columns]
 
         months = ["JAN","FEB","MAR","APR","MAY","JUN","JUL","AUG","SEP","OCT","NOV","DEC"]
-        # ensure month cols exist and are numeric
-        for m in months:
-            if m in df.columns:
-                df[m] = df[m].apply(f)
-            else:
-                df[m] = 0
-
-        # numeric helpers
-        df["Cumulative Debt (2024 & Prior)"] = df.get("Cumulative Debt (2024 & Prior)", 0).apply(f)
-        df["YTD"]          = df.get("YTD", 0).apply(f)
-        df["Current Debt"] = df.get("Current Debt", 0).apply(f)
+        # ensure month/debt/YTD cols exist and are numeric
+        for c in months + ["Cumulative Debt (2024 & Prior)", "YTD", "Current Debt"]:
+            df[c] = f_col(df[c]) if c in df.columns else 0.0
 
         # build rows, skipping records without a House No (needed for ON CONFLICT)
         rows = []
@@ -151,7 +148,7 @@ with psycopg2.connect(**dsn) as conn:
                   cumulative_debt = EXCLUDED.cumulative_debt,
                   jan=EXCLUDED.jan, feb=EXCLUDED.feb, mar=EXCLUDED.mar, apr=EXCLUDED.apr, may=EXCLUDED.may, jun=EXCLUDED.jun,
                   jul=EXCLUDED.jul, aug=EXCLUDED.aug, sep=EXCLUDED.sep, oct=EXCLUDED.oct, nov=EXCLUDED.nov, dec=EXCLUDED.dec,
-                  ytd           = EXCLUDED.ytd,
+                  ytd           = EXCLUDED.ytd,  -- recomputed from the months where the contributions_set_ytd trigger is installed
                   current_debt  = EXCLUDED.current_debt,
                   remarks       = EXCLUDED.remarks,
                   updated_at    = now();
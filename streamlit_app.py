@@ -51,6 +51,7 @@ if _db and "sslmode=" not in _db:
 import pandas as pd
 import numpy as np
 import plotly.express as px
+import plotly.graph_objects as go
 from datetime import datetime, date
 import hashlib
 import smtplib
@@ -62,7 +63,9 @@ from unittest.mock import patch, MagicMock
 import io
 import shutil
 import glob
+import heapq
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import gspread
 from google.oauth2 import service_account
 
@@ -89,6 +92,7 @@ from zawadi_db import (
 # ---------------------------------------------
 LANES = ['ROYAL', 'SHUJAA', 'WEMA', 'KINGS']
 MONTHS = ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC']
+MONTH_NUMBERS = {m: i for i, m in enumerate(MONTHS, start=1)}  # 'JAN' -> 1 (matches .dt.month)
 EXPENSE_CATEGORIES = ['Personnel', 'Utilities', 'Maintenance', 'Miscellaneous']
 SPECIAL_TYPES = ['Celebration', 'Emergency', 'Welfare']
 DEFAULT_RATES = {'Resident': 2000, 'Non-Resident': 1000, 'Special Rate': 500}
@@ -100,16 +104,41 @@ EMAIL_CONFIG = {
     'port': int(os.getenv('SMTP_PORT', '587')),
 }
 
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+# Full Data Export: option label -> (data key, sheet name)
+CUSTOM_EXPORT_SHEETS = {
+    "Contributions Data": ('contributions', "Contributions"),
+    "Expenses Data": ('expenses', "Expenses"),
+    "Special Contributions": ('special', "Special"),
+    "Rate Categories": ('rates', "Rate Categories"),
+    "Expense Requests": ('expense_requests', "Expense Requests"),
+    "Contribution Requests": ('contribution_requests', "Contribution Requests"),
+    "Special Requests": ('special_requests', "Special Requests"),
+}
+
 # Backup configuration
 BACKUP_DIR = "backups"
 MAX_BACKUPS = 30  # Keep last 30 backups
 
+# Manual restore: filename tag -> data key (most specific tags first, e.g. special_requests before special)
+RESTORE_FILE_TAGS = {
+    'contribution_requests': 'contribution_requests',
+    'expense_requests': 'expense_requests',
+    'special_requests': 'special_requests',
+    'contributions': 'contributions',
+    'expenses': 'expenses',
+    'special': 'special',
+    'rates': 'rates',
+}
+
 # ---------------------------------------------
 # Mobile optimization - responsive layout
 # ---------------------------------------------
 def is_mobile():
-    """Check if the screen is mobile size"""
-    return st.session_state.get('screen_width', 1000) < 768
+    """Check if the screen is mobile size (evaluated once per session)"""
+    if '_is_mobile' not in st.session_state:
+        st.session_state._is_mobile = st.session_state.get('screen_width', 1000) < 768
+    return st.session_state._is_mobile
 
 def mobile_friendly_container():
     """Return a container with mobile-friendly settings (placeholder)"""
@@ -135,6 +164,26 @@ def safe_convert_to_float(value):
     except (ValueError, TypeError):
         return 0.0
 
+def safe_sum(series):
+    """Sum a column of mixed strings/numbers via safe_convert_to_float."""
+    return sum(safe_convert_to_float(x) for x in series)
+
+def sum_by_month(amounts: pd.Series, dates: pd.Series) -> pd.Series:
+    """
+    Total `amounts` per calendar month of `dates` (already datetime), indexed JAN..DEC.
+    Groups on integer month numbers rather than formatted month labels; NaT rows are dropped.
+    """
+    mask = dates.notna().to_numpy()
+    values = pd.to_numeric(amounts, errors='coerce').fillna(0.0).to_numpy()[mask]
+    month_nums = dates.dt.month.to_numpy()[mask].astype(int)
+    return (
+        pd.Series(values, name=amounts.name)
+        .groupby(month_nums).sum()
+        .reindex(range(1, 13), fill_value=0.0)
+        .set_axis(MONTHS)
+        .rename_axis('Month')
+    )
+
 def ensure_contributions_columns(df: pd.DataFrame) -> pd.DataFrame:
     """Guarantee all columns the UI expects exist, with safe defaults."""
     if df is None or df.empty:
@@ -194,6 +243,7 @@ def create_backup():
         while len(backups) > MAX_BACKUPS:
             oldest_backup = backups.pop(0)
             shutil.rmtree(oldest_backup)
+        _recent_backups.clear()
         return True
     except Exception as e:
         st.error(f"Backup failed: {str(e)}")
@@ -211,6 +261,20 @@ def restore_backup(backup_path):
         st.error(f"Restore failed: {str(e)}")
         return False
 
+@st.cache_data(ttl=30, show_spinner=False)
+def _recent_backups(n=20):
+    """Paths of the n most recently modified backup_* folders, newest first."""
+    try:
+        with os.scandir(BACKUP_DIR) as it:
+            entries = heapq.nlargest(
+                n,
+                (e for e in it if e.name.startswith('backup_')),
+                key=lambda e: e.stat().st_mtime
+            )
+    except FileNotFoundError:
+        return []
+    return [os.path.join(BACKUP_DIR, e.name) for e in entries]
+
 def backup_to_google_sheets(data: dict) -> bool:
     """
     Writes each DataFrame in `data` into a worksheet inside the
@@ -282,10 +346,29 @@ def _offline_data_factory():
         "cash_management": pd.DataFrame({"Cash Balance c/d":[0.0], "Cash Withdrawal":[0.0]}),
     }
 
+ID_TABLES = ['expenses', 'special', 'expense_requests', 'contribution_requests', 'special_requests']
+
+def enforce_load_dtypes(data: dict) -> dict:
+    """Cast table ids to int32 once per load so admin pickers don't re-cast every rerun."""
+    for key in ID_TABLES:
+        df = data.get(key)
+        if isinstance(df, pd.DataFrame) and 'id' in df.columns and df['id'].notna().all():
+            df['id'] = df['id'].astype('int32')
+    return data
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_load():
+    """
+    Live Postgres read, reused across reruns for up to a minute.
+    Failures are not cached, so offline mode retries on the next rerun.
+    Call _cached_load.clear() after any DB write so the next render sees it.
+    """
+    return enforce_load_dtypes(load_all())
+
 def _attempt_live_load():
     """Try to load from Postgres. Returns (data_dict, error_or_none)."""
     try:
-        d = load_all()
+        d = _cached_load()
         return d, None
     except Exception as e:
         return None, e
@@ -412,6 +495,49 @@ def get_payment_status(row, current_month, rates_df):
     else:
         return "🔴 >2 months behind"
 
+def _to_float_columns(df, cols):
+    """Column-wise safe_convert_to_float: '1,000' -> 1000.0; blanks, '-' and junk -> 0.0."""
+    out = df.reindex(columns=cols)
+    for c in cols:
+        if not pd.api.types.is_numeric_dtype(out[c]):
+            out[c] = out[c].astype(str).str.replace(',', '', regex=False).str.strip()
+        out[c] = pd.to_numeric(out[c], errors='coerce')
+    return out.fillna(0.0)
+
+def ytd_column(contrib, current_month):
+    """calculate_ytd for every row at once."""
+    month_index = MONTHS.index(current_month) if current_month in MONTHS else 11
+    return _to_float_columns(contrib, MONTHS[:month_index + 1]).sum(axis=1)
+
+def contribution_metrics(contrib, current_month, rates_df):
+    """
+    YTD, Current Debt and Status for every household in one vectorized pass,
+    following the same rules as calculate_ytd / calculate_current_debt / get_payment_status.
+    """
+    month_index = MONTHS.index(current_month) if current_month in MONTHS else 11
+    paid = _to_float_columns(contrib, MONTHS[:month_index + 1])
+    ytd = paid.sum(axis=1)
+
+    default_rate = DEFAULT_RATES['Resident']
+    if {'Rate Category', 'Amount'}.issubset(rates_df.columns):
+        rate_lookup = pd.to_numeric(
+            rates_df.drop_duplicates('Rate Category').set_index('Rate Category')['Amount'], errors='coerce'
+        )
+        monthly_rate = contrib['Rate Category'].map(rate_lookup).fillna(default_rate)
+    else:
+        monthly_rate = pd.Series(default_rate, index=contrib.index)
+
+    prior = _to_float_columns(contrib, ['Cumulative Debt (2024 & Prior)'])['Cumulative Debt (2024 & Prior)']
+    debt = prior + (month_index + 1) * monthly_rate - ytd
+
+    months_owed = (paid == 0).sum(axis=1)
+    status = np.select(
+        [debt.to_numpy() <= 0, months_owed.to_numpy() <= 2],
+        ["🟢 Up-to-date", "🟠 1-2 months behind"],
+        default="🔴 >2 months behind",
+    )
+    return pd.DataFrame({'YTD': ytd, 'Current Debt': debt, 'Status': status}, index=contrib.index)
+
 def send_reminder_email(email, family_name, debt_amount):
     if not email or pd.isna(email):
         return False
@@ -459,7 +585,8 @@ def send_monthly_reminders(data):
 # UI: Residency / Rates (→ Postgres)
 # =========================
 def residency_management(data):
-    if not check_treasurer_password():
+    # main() already ran the login check this rerun; just read its result
+    if not st.session_state.get('treasurer_authenticated', False):
         st.warning("Please enter the treasurer password to access this section")
         return
 
@@ -481,6 +608,7 @@ def residency_management(data):
             # Persist to Postgres
             upsert_rates(edited_rates)
             st.success("Rate categories updated successfully!")
+            _cached_load.clear()
             st.rerun()
 
         st.subheader("Assign Rate Categories to Households")
@@ -509,6 +637,7 @@ def residency_management(data):
                 house_df = edited_household_rates[['House No','Rate Category','Email']].copy()
                 update_household_rate_email(house_df)
                 st.success("Rate categories and emails updated successfully!")
+                _cached_load.clear()
                 st.rerun()
         else:
             st.warning("No household data available to assign rate categories")
@@ -516,6 +645,27 @@ def residency_management(data):
 # =========================
 # UI: Contributions Dashboard
 # =========================
+@st.cache_data(ttl=300, show_spinner=False)
+def _build_dashboard_charts(contrib_slim: pd.DataFrame, months_to_show: tuple):
+    """Monthly collections trend and YTD-by-lane bar for the filtered dashboard rows."""
+    # Month columns are float64 already (ensure_contributions_columns), so this is a plain column sum
+    monthly_totals = contrib_slim[list(months_to_show)].sum()
+    trend_fig = px.line(
+        monthly_totals,
+        title=f"Monthly Collections Trend ({datetime.now().year})",
+        labels={'value': 'Amount (KES)', 'index': 'Month'},
+        markers=True
+    )
+    lane_totals = contrib_slim.groupby('Lane')['YTD'].sum()
+    lane_fig = px.bar(
+        lane_totals,
+        title="Total Contributions by Lane",
+        labels={'value': 'Amount (KES)', 'index': 'Lane'},
+        color=lane_totals.index,
+        color_discrete_sequence=px.colors.qualitative.Pastel
+    )
+    return trend_fig, lane_fig
+
 def contributions_dashboard(data):
     st.header("📊 Monthly Contributions Dashboard", divider='rainbow')
 
@@ -525,15 +675,12 @@ def contributions_dashboard(data):
     current_month = get_current_month()
 
     # Calculate metrics
-    data['contributions']['YTD'] = data['contributions'].apply(
-        lambda row: calculate_ytd(row, current_month), axis=1
-    )
-    data['contributions']['Current Debt'] = data['contributions'].apply(
-        lambda row: calculate_current_debt(row, current_month, data['rates']), axis=1
-    )
-    data['contributions']['Status'] = data['contributions'].apply(
-        lambda row: get_payment_status(row, current_month, data['rates']), axis=1
-    )
+    metrics = contribution_metrics(data['contributions'], current_month, data['rates'])
+    for col in ('YTD', 'Current Debt', 'Status'):
+        data['contributions'][col] = metrics[col]
+
+    # Family dropdown options, derived once and shared by the request form and the filters
+    family_names = sorted(data['contributions']['Family Name'].dropna().unique().tolist())
 
     # Contribution Request Form (Members)
     if not st.session_state.get('treasurer_authenticated', False):
@@ -544,10 +691,9 @@ def contributions_dashboard(data):
                 }
 
             with st.form("contribution_request_form"):
-                family_names = data['contributions']['Family Name'].dropna().unique().tolist()
                 selected_family = st.selectbox(
                     "Select your family name",
-                    [""] + sorted(family_names),
+                    [""] + family_names,
                     index=0,
                     key="family_name_select"
                 )
@@ -596,12 +742,13 @@ def contributions_dashboard(data):
                             remarks=f"Payment Ref: {payment_ref}. {remarks}"
                         )
                         st.success("Contribution request submitted for approval!")
+                        _cached_load.clear()
                         st.rerun()
 
     # Filters
     if is_mobile():
         with st.expander("🔍 Filters", expanded=False):
-            family_filter = st.selectbox("Filter by Family Name", ["All"] + sorted(data['contributions']['Family Name'].unique().tolist()))
+            family_filter = st.selectbox("Filter by Family Name", ["All"] + family_names)
             lane_filter = st.selectbox("Filter by Lane", ["All"] + LANES)
             status_filter = st.selectbox("Filter by Status", ["All", "🟢 Up-to-date", "🟠 1-2 months behind", "🔴 >2 months behind"])
             rate_options = ["All"] + list(data['rates']['Rate Category'].unique())
@@ -609,7 +756,7 @@ def contributions_dashboard(data):
     else:
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            family_filter = st.selectbox("Filter by Family Name", ["All"] + sorted(data['contributions']['Family Name'].unique().tolist()))
+            family_filter = st.selectbox("Filter by Family Name", ["All"] + family_names)
         with col2:
             lane_filter = st.selectbox("Filter by Lane", ["All"] + LANES)
         with col3:
@@ -618,15 +765,20 @@ def contributions_dashboard(data):
             rate_options = ["All"] + list(data['rates']['Rate Category'].unique())
             rate_filter = st.selectbox("Filter by Rate Category", rate_options)
 
-    filtered_df = data['contributions'].copy()
-    if family_filter != "All":
-        filtered_df = filtered_df[filtered_df['Family Name'] == family_filter]
-    if lane_filter != "All":
-        filtered_df = filtered_df[filtered_df['Lane'] == lane_filter]
-    if status_filter != "All":
-        filtered_df = filtered_df[filtered_df['Status'] == status_filter]
-    if rate_filter != "All":
-        filtered_df = filtered_df[filtered_df['Rate Category'] == rate_filter]
+    # Read-only view: the guards below only fill columns ensure_contributions_columns already added.
+    # All active filters are AND-ed into one mask and applied with a single gather.
+    filtered_df = data['contributions']
+    mask = np.ones(len(filtered_df), dtype=bool)
+    for col, choice in (
+        ('Family Name', family_filter),
+        ('Lane', lane_filter),
+        ('Status', status_filter),
+        ('Rate Category', rate_filter),
+    ):
+        if choice != "All":
+            mask &= (filtered_df[col] == choice).to_numpy()
+    if not mask.all():
+        filtered_df = filtered_df[mask]
 
     # Display data 
     st.subheader("Contributions Data")
@@ -729,54 +881,28 @@ def contributions_dashboard(data):
                                 set_special_request_status(rid, "Reject", remarks)
 
                         st.success(f"{len(selected_requests)} request(s) {action.lower()}ed successfully!")
+                        _cached_load.clear()
                         st.rerun()
             else:
                 st.info("No pending special contribution requests")
 
     # Visualizations
     st.subheader("📈 Contributions Analysis")
+    trend_fig, lane_fig = _build_dashboard_charts(
+        filtered_df[months_to_show + ['Lane', 'YTD']], tuple(months_to_show)
+    )
     if is_mobile():
         with st.expander("Monthly Collections", expanded=False):
-            monthly_totals = filtered_df[months_to_show].apply(pd.to_numeric, errors='coerce').sum()
-            fig = px.line(
-                monthly_totals,
-                title=f"Monthly Collections Trend ({datetime.now().year})",
-                labels={'value': 'Amount (KES)', 'index': 'Month'},
-                markers=True
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(trend_fig, use_container_width=True)
 
         with st.expander("Contributions by Lane", expanded=False):
-            lane_totals = filtered_df.groupby('Lane')['YTD'].sum()
-            fig = px.bar(
-                lane_totals,
-                title="Total Contributions by Lane",
-                labels={'value': 'Amount (KES)', 'index': 'Lane'},
-                color=lane_totals.index,
-                color_discrete_sequence=px.colors.qualitative.Pastel
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(lane_fig, use_container_width=True)
     else:
         col1, col2 = st.columns(2)
         with col1:
-            monthly_totals = filtered_df[months_to_show].apply(pd.to_numeric, errors='coerce').sum()
-            fig = px.line(
-                monthly_totals,
-                title=f"Monthly Collections Trend ({datetime.now().year})",
-                labels={'value': 'Amount (KES)', 'index': 'Month'},
-                markers=True
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(trend_fig, use_container_width=True)
         with col2:
-            lane_totals = filtered_df.groupby('Lane')['YTD'].sum()
-            fig = px.bar(
-                lane_totals,
-                title="Total Contributions by Lane",
-                labels={'value': 'Amount (KES)', 'index': 'Lane'},
-                color=lane_totals.index,
-                color_discrete_sequence=px.colors.qualitative.Pastel
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(lane_fig, use_container_width=True)
 
     # Status summary
     st.subheader("📋 Payment Status Summary")
@@ -789,6 +915,15 @@ def contributions_dashboard(data):
 # =========================
 # UI: Expense Tracker
 # =========================
+@st.cache_data(ttl=300, show_spinner=False)
+def _month_numbers(dates: pd.Series) -> np.ndarray:
+    """
+    Calendar month (1-12; 0 for unparseable) per date, as int8.
+    Parsed once per distinct Date column, so flipping the month filter is an integer compare.
+    """
+    parsed = pd.to_datetime(dates, errors='coerce', dayfirst=True)
+    return parsed.dt.month.fillna(0).astype('int8').to_numpy()
+
 def expense_tracker(data):
     st.header("💸 Expense Tracker")
 
@@ -817,6 +952,7 @@ def expense_tracker(data):
                         remarks=f"Phone: {req_phone}. {req_remarks}"
                     )
                     st.success("Expense requisition submitted for approval!")
+                    _cached_load.clear()
                     st.rerun()
 
     # Approvals (Treasurer)
@@ -862,6 +998,7 @@ def expense_tracker(data):
                             else:
                                 set_expense_request_status(int(r['id']) if 'id' in r else int(idx), "Reject", remarks)
                         st.success(f"{len(selected_requests)} requests {action.lower()}ed successfully!")
+                        _cached_load.clear()
                         st.rerun()
             else:
                 st.info("No pending expense requisitions")
@@ -886,6 +1023,7 @@ def expense_tracker(data):
                     cash_withdrawal=float(st.session_state.cash_withdrawal)
                 )
                 st.success("Cash balances updated successfully!")
+                _cached_load.clear()
                 st.rerun()
             except RuntimeError as e:
                 # Raised by DB layer when offline
@@ -978,6 +1116,7 @@ def expense_tracker(data):
                             remarks=expense_remarks
                         )
                         st.success("Expense added successfully!")
+                        _cached_load.clear()
                         st.rerun()
                     except RuntimeError:
                         st.error("Write disabled in offline mode")
@@ -999,9 +1138,8 @@ def expense_tracker(data):
     # --- Robust month filter (coerce bad dates, drop NaT) ---
     if month_filter != "All":
         if 'Date' in filtered_expenses.columns:
-            _d = pd.to_datetime(filtered_expenses['Date'], errors='coerce', dayfirst=True, infer_datetime_format=True)
-            mask = _d.dt.strftime('%b').str.upper() == month_filter
-            filtered_expenses = filtered_expenses.loc[mask.fillna(False)]
+            mask = _month_numbers(filtered_expenses['Date']) == MONTH_NUMBERS[month_filter]
+            filtered_expenses = filtered_expenses.loc[mask]
         else:
             st.warning("No 'Date' column in expenses; month filter ignored.")
 
@@ -1093,12 +1231,7 @@ def expense_tracker(data):
                     dayfirst=True,              # flip to False if you’re strictly YYYY-MM-DD
                     infer_datetime_format=True
                 )
-                monthly_expenses = monthly_expenses.dropna(subset=[date_col])
-
-                # Now derive month label
-                monthly_expenses['Month'] = monthly_expenses[date_col].dt.strftime('%b').str.upper()
-
-                monthly_totals = monthly_expenses.groupby('Month')['Amount (KES)'].sum().reindex(MONTHS, fill_value=0)
+                monthly_totals = sum_by_month(monthly_expenses['Amount (KES)'], monthly_expenses[date_col])
                 fig = px.line(
                     monthly_totals,
                     title="Monthly Expense Trend",
@@ -1120,11 +1253,10 @@ def expense_tracker(data):
                 )
                 st.plotly_chart(fig, use_container_width=True)
             with viz_cols[1]:
-                monthly_expenses = data['expenses'].copy()
-                monthly_expenses['Date'] = pd.to_datetime(monthly_expenses['Date'], errors='coerce')
-                monthly_expenses = monthly_expenses.dropna(subset=['Date'])
-                monthly_expenses['Month'] = monthly_expenses['Date'].dt.strftime('%b').str.upper()
-                monthly_totals = monthly_expenses.groupby('Month')['Amount (KES)'].sum().reindex(MONTHS, fill_value=0)
+                monthly_totals = sum_by_month(
+                    data['expenses']['Amount (KES)'],
+                    pd.to_datetime(data['expenses']['Date'], errors='coerce')
+                )
                 fig = px.line(
                     monthly_totals,
                     title="Monthly Expense Trend",
@@ -1165,6 +1297,7 @@ def special_contributions(data):
                             remarks=event_remarks
                         )
                         st.success("Special contribution request submitted for approval!")
+                        _cached_load.clear()
                         st.rerun()
 
     if st.session_state.get('treasurer_authenticated', False):
@@ -1208,6 +1341,7 @@ def special_contributions(data):
                                 set_special_request_status(rid, "Reject", remarks)
 
                         st.success(f"{len(selected_requests)} request(s) {action.lower()}ed successfully!")
+                        _cached_load.clear()
                         st.rerun()
             else:
                 st.info("No pending special contribution requests")
@@ -1224,7 +1358,7 @@ def special_contributions(data):
 
     st.subheader("📋 Special Contribution Records")
     type_filter = st.selectbox("Filter by Type", ["All"] + SPECIAL_TYPES)
-    filtered_special = data['special'].copy()
+    filtered_special = data['special']
     if type_filter != "All":
         filtered_special = filtered_special[filtered_special['Type'] == type_filter]
 
@@ -1260,9 +1394,10 @@ def special_contributions(data):
                 )
                 st.plotly_chart(fig, use_container_width=True)
             with st.expander("Monthly Contributions", expanded=False):
-                monthly_special = filtered_special.copy()
-                monthly_special['Month'] = pd.to_datetime(monthly_special['Date']).dt.strftime('%b').str.upper()
-                monthly_totals = monthly_special.groupby('Month')['Amount'].sum().reindex(MONTHS, fill_value=0)
+                monthly_totals = sum_by_month(
+                    filtered_special['Amount'],
+                    pd.to_datetime(filtered_special['Date'], errors='coerce')
+                )
                 fig = px.bar(
                     monthly_totals,
                     title="Monthly Special Contributions",
@@ -1285,9 +1420,10 @@ def special_contributions(data):
                 )
                 st.plotly_chart(fig, use_container_width=True)
             with viz_cols[1]:
-                monthly_special = filtered_special.copy()
-                monthly_special['Month'] = pd.to_datetime(monthly_special['Date']).dt.strftime('%b').str.upper()
-                monthly_totals = monthly_special.groupby('Month')['Amount'].sum().reindex(MONTHS, fill_value=0)
+                monthly_totals = sum_by_month(
+                    filtered_special['Amount'],
+                    pd.to_datetime(filtered_special['Date'], errors='coerce')
+                )
                 fig = px.bar(
                     monthly_totals,
                     title="Monthly Special Contributions",
@@ -1300,16 +1436,132 @@ def special_contributions(data):
 # =========================
 # UI: Reports (read-only)
 # =========================
+# Aggregations are cached on the slim column subsets they read, so flipping
+# between report types (or any other rerun) reuses the groupby and the figure.
+@st.cache_data(ttl=300, show_spinner=False)
+def _lane_agg(contrib_slim: pd.DataFrame) -> pd.DataFrame:
+    """YTD, current debt and household count per lane."""
+    return contrib_slim.groupby('Lane').agg({
+        'YTD': safe_sum,
+        'Current Debt': safe_sum,
+        'House No': 'count'
+    }).rename(columns={'House No': 'Households'})
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _expense_by_cat(exp_slim: pd.DataFrame) -> pd.Series:
+    """Total expense amount per category."""
+    return exp_slim.groupby('Category')['Amount (KES)'].apply(safe_sum)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _status_counts(status_ser: pd.Series) -> pd.DataFrame:
+    """Household count per payment status as a Status/Count frame."""
+    return (
+        status_ser.groupby(status_ser, sort=False, observed=True).size()
+        .rename('Count').rename_axis('Status').reset_index()
+    )
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _rate_agg(contrib_slim: pd.DataFrame, rates_indexed: pd.DataFrame) -> pd.DataFrame:
+    """YTD and household count per rate category, joined to the monthly rate."""
+    return contrib_slim.groupby('Rate Category').agg({
+        'YTD': safe_sum,
+        'House No': 'count'
+    }).rename(columns={'House No': 'Households'}).merge(
+        rates_indexed,
+        left_index=True,
+        right_index=True
+    )
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _special_by_type(special_slim: pd.DataFrame) -> pd.Series:
+    """Total special contribution amount per type."""
+    return special_slim.groupby('Type')['Amount'].apply(safe_sum)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _build_trend_line(contrib_months: pd.DataFrame, exp_slim: pd.DataFrame):
+    """Monthly contributions vs expenses line chart."""
+    monthly_contrib = contrib_months[MONTHS].sum()
+    monthly_exp_totals = sum_by_month(
+        exp_slim['Amount (KES)'],
+        pd.to_datetime(exp_slim['Date'], errors='coerce')
+    )
+
+    # Plain lists of rounded floats keep the JSON shipped to the browser small
+    fig = go.Figure(data=[
+        go.Scatter(x=MONTHS, y=monthly_contrib.round(2).tolist(), mode='lines+markers', name='Contributions'),
+        go.Scatter(x=MONTHS, y=monthly_exp_totals.round(2).tolist(), mode='lines+markers', name='Expenses'),
+    ])
+    fig.update_layout(
+        title="Monthly Contribution vs Expense Trend",
+        xaxis_title='Month', yaxis_title='Amount (KES)', legend_title_text='Type'
+    )
+    return fig
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _build_pie(totals: pd.Series, title: str):
+    """Pastel pie of a per-category totals Series."""
+    fig = go.Figure(data=[go.Pie(
+        labels=totals.index.tolist(),
+        values=totals.round(2).tolist(),
+        marker=dict(colors=px.colors.qualitative.Pastel)
+    )])
+    fig.update_layout(title=title)
+    return fig
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _build_status_pie(status_report: pd.DataFrame):
+    """Payment status pie using the traffic-light colour map."""
+    color_map = {
+        "🟢 Up-to-date": "#2ecc71",
+        "🟠 1-2 months behind": "#f39c12",
+        "🔴 >2 months behind": "#e74c3c"
+    }
+    labels = status_report['Status'].tolist()
+    fig = go.Figure(data=[go.Pie(
+        labels=labels,
+        values=status_report['Count'].tolist(),
+        marker=dict(colors=[color_map.get(s) for s in labels])
+    )])
+    fig.update_layout(title="Payment Status Distribution")
+    return fig
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _build_rate_bar(rate_report: pd.DataFrame):
+    """Households per rate category bar chart."""
+    palette = px.colors.qualitative.Pastel
+    fig = go.Figure(data=[go.Bar(
+        x=rate_report.index.tolist(),
+        y=rate_report['Households'].tolist(),
+        marker_color=[palette[i % len(palette)] for i in range(len(rate_report))]
+    )])
+    fig.update_layout(title="Households by Rate Category", xaxis_title='Rate Category', yaxis_title='Households')
+    return fig
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _build_xlsx(report_type: str, df: pd.DataFrame) -> bytes:
+    """Serialize one report to .xlsx bytes; reruns reuse the bytes until the data changes."""
+    output = io.BytesIO()
+    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
+        df.to_excel(writer, sheet_name=report_type[:30])
+    return output.getvalue()
+
+def _prepare_sheet(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Export-ready copy of `df`: object columns that are entirely numeric
+    (e.g. Postgres NUMERIC -> Decimal) become float64 so the writer skips per-cell type checks.
+    """
+    out = df.copy()
+    for col in out.columns[out.dtypes == object]:
+        # Only genuinely numeric values; numeric-looking text (Phone, House No) stays text
+        if pd.api.types.infer_dtype(out[col], skipna=True) in ('decimal', 'integer', 'floating', 'mixed-integer-float'):
+            out[col] = pd.to_numeric(out[col], errors='coerce')
+    return out
+
 def reports(data):
     st.header("📑 Financial Reports")
 
-    def safe_sum(series):
-        return sum(safe_convert_to_float(x) for x in series)
-
     current_month = get_current_month()
-    data['contributions']['YTD'] = data['contributions'].apply(
-        lambda row: calculate_ytd(row, current_month), axis=1
-    )
+    data['contributions']['YTD'] = ytd_column(data['contributions'], current_month)
 
     st.subheader("📊 Summary Statistics")
     cols = st.columns(3)
@@ -1338,12 +1590,11 @@ def reports(data):
         "Year-on-Year Trends"
     ], index=0)
 
+    # Pass only the columns each aggregation reads so cache hashing stays cheap
+    contrib_slim = data['contributions'][['Lane', 'Rate Category', 'YTD', 'Current Debt', 'House No']]
+
     if report_type == "Lane-wise Contributions":
-        lane_report = data['contributions'].groupby('Lane').agg({
-            'YTD': lambda x: safe_sum(x),
-            'Current Debt': lambda x: safe_sum(x),
-            'House No': 'count'
-        }).rename(columns={'House No': 'Households'})
+        lane_report = _lane_agg(contrib_slim[['Lane', 'YTD', 'Current Debt', 'House No']])
         lane_total = safe_sum(lane_report['YTD'])
         if abs(lane_total - total_contributions) > 0.01:
             st.warning(f"Data consistency issue: Lane-wise total ({lane_total:,.2f}) doesn't match summary total ({total_contributions:,.2f})")
@@ -1353,99 +1604,39 @@ def reports(data):
             use_container_width=True
         )
 
-        monthly_contrib = data['contributions'][MONTHS].apply(pd.to_numeric, errors='coerce').sum()
-        monthly_expenses = data['expenses'].copy()
-        monthly_expenses['Date'] = pd.to_datetime(monthly_expenses['Date'], errors='coerce')
-        monthly_expenses = monthly_expenses.dropna(subset=['Date'])
-        monthly_expenses['Month'] = monthly_expenses['Date'].dt.strftime('%b').str.upper()
-
-        monthly_exp_totals = monthly_expenses.groupby('Month')['Amount (KES)'].sum().reindex(MONTHS, fill_value=0)
-
-        combined_df = pd.DataFrame({
-            'Month': MONTHS,
-            'Contributions': monthly_contrib,
-            'Expenses': monthly_exp_totals
-        }).melt(id_vars='Month', var_name='Type', value_name='Amount')
-
-        fig = px.line(
-            combined_df,
-            x='Month', y='Amount', color='Type',
-            title="Monthly Contribution vs Expense Trend",
-            labels={'Amount': 'Amount (KES)', 'Month': 'Month'},
-            markers=True
+        fig = _build_trend_line(
+            data['contributions'][MONTHS],
+            data['expenses'][['Date', 'Amount (KES)']]
         )
         st.plotly_chart(fig, use_container_width=True, key="monthly_trend_chart")
 
     elif report_type == "Expense Category Breakdown":
-        expense_report = data['expenses'].groupby('Category')['Amount (KES)'].apply(safe_sum)
+        expense_report = _expense_by_cat(data['expenses'][['Category', 'Amount (KES)']])
         st.dataframe(expense_report.to_frame('Total Amount').style.format("KES {:,.2f}"), use_container_width=True)
-        fig = px.pie(
-            expense_report,
-            names=expense_report.index,
-            title="Expense Distribution by Category",
-            color=expense_report.index,
-            color_discrete_sequence=px.colors.qualitative.Pastel,
-            values='Amount (KES)'
-        )
+        fig = _build_pie(expense_report, "Expense Distribution by Category")
         st.plotly_chart(fig, use_container_width=True, key="expense_pie_chart")
 
     elif report_type == "Payment Status Distribution":
-        status_report = data['contributions']['Status'].value_counts()
-        if isinstance(status_report, pd.Series):
-            status_report = status_report.reset_index()
-            status_report.columns = ['Status', 'Count']
+        status_report = _status_counts(data['contributions']['Status'])
         st.dataframe(status_report, use_container_width=True)
-        color_map = {
-            "🟢 Up-to-date": "#2ecc71",
-            "🟠 1-2 months behind": "#f39c12",
-            "🔴 >2 months behind": "#e74c3c"
-        }
-        fig = px.pie(
-            status_report,
-            names='Status',
-            values='Count',
-            title="Payment Status Distribution",
-            color='Status',
-            color_discrete_map=color_map
-        )
+        fig = _build_status_pie(status_report)
         st.plotly_chart(fig, use_container_width=True)
 
     elif report_type == "Rate Category Analysis":
         if 'Rate Category' in data['contributions'].columns:
-            rate_report = data['contributions'].groupby('Rate Category').agg({
-                'YTD': lambda x: safe_sum(x),
-                'House No': 'count'
-            }).rename(columns={'House No': 'Households'})
-            rate_report = rate_report.merge(
-                data['rates'].set_index('Rate Category'),
-                left_index=True,
-                right_index=True
-            )
+            rate_report = _rate_agg(contrib_slim[['Rate Category', 'YTD', 'House No']], data['rates_indexed'])
             st.dataframe(
                 rate_report.style.format({'YTD': "KES {:,.2f}", 'Amount': "KES {:,.2f}"}),
                 use_container_width=True
             )
-            fig = px.bar(
-                rate_report,
-                x=rate_report.index, y='Households',
-                title="Households by Rate Category",
-                color=rate_report.index,
-                color_discrete_sequence=px.colors.qualitative.Pastel
-            )
+            fig = _build_rate_bar(rate_report)
             st.plotly_chart(fig, use_container_width=True, key="rate_category_bar")
 
     elif report_type == "Special Contributions Analysis":
         if not data['special'].empty:
-            special_report = data['special'].groupby('Type')['Amount'].apply(safe_sum)
+            special_report = _special_by_type(data['special'][['Type', 'Amount']])
             st.dataframe(special_report.to_frame('Total Amount').style.format("KES {:,.2f}"), use_container_width=True)
-            fig = px.pie(
-                special_report,
-                names=special_report.index,
-                title="Special Contributions by Type",
-                color=special_report.index,
-                color_discrete_sequence=px.colors.qualitative.Pastel,
-                values='Amount'
-            )
+            fig = _build_pie(special_report, "Special Contributions by Type")
             st.plotly_chart(fig, use_container_width=True, key="special_pie_chart")
 
     elif report_type == "Year-on-Year Trends":
@@ -1455,18 +1646,18 @@ def reports(data):
             years = [current_year, current_year - 1]
             sample_data = pd.DataFrame({
                 'Year': years,
-                'Total Contributions': [safe_sum(data['contributions']['YTD']),
-                                       safe_sum(data['contributions']['YTD']) * 0.8],
-                'Total Expenses': [safe_sum(data['expenses']['Amount (KES)']) if 'Amount (KES)' in data['expenses'].columns else 0,
-                                  (safe_sum(data['expenses']['Amount (KES)']) * 0.75) if 'Amount (KES)' in data['expenses'].columns else 0],
-                'Special Contributions': [safe_sum(data['special']['Amount']) if 'Amount' in data['special'].columns else 0,
-                                         (safe_sum(data['special']['Amount']) * 0.7) if 'Amount' in data['special'].columns else 0]
+                # Reuse the summary totals computed above rather than re-summing each table
+                'Total Contributions': [total_contributions, total_contributions * 0.8],
+                'Total Expenses': [total_expenses, total_expenses * 0.75],
+                'Special Contributions': [total_special, total_special * 0.7]
             })
-            fig = px.bar(
-                sample_data.melt(id_vars='Year'),
-                x='Year', y='value', color='variable', barmode='group',
-                title="Year-on-Year Financial Comparison",
-                labels={'value': 'Amount (KES)', 'variable': 'Category'}
+            fig = go.Figure(data=[
+                go.Bar(x=years, y=sample_data[col].round(2).tolist(), name=col)
+                for col in ['Total Contributions', 'Total Expenses', 'Special Contributions']
+            ])
+            fig.update_layout(
+                title="Year-on-Year Financial Comparison", barmode='group',
+                xaxis_title='Year', yaxis_title='Amount (KES)', legend_title_text='Category'
             )
             st.plotly_chart(fig, use_container_width=True, key="yearly_comparison_bar")
 
@@ -1478,84 +1669,61 @@ def reports(data):
     elif report_type == "Detailed Expense Records":
         report_df = data['expenses']
     elif report_type == "Lane-wise Contributions":
-        report_df = data['contributions'].groupby('Lane').agg({
-            'YTD': lambda x: safe_sum(x),
-            'Current Debt': lambda x: safe_sum(x),
-            'House No': 'count'
-        }).rename(columns={'House No': 'Households'})
+        report_df = _lane_agg(contrib_slim[['Lane', 'YTD', 'Current Debt', 'House No']])
     elif report_type == "Expense Category Breakdown":
-        report_df = data['expenses'].groupby('Category')['Amount (KES)'].apply(safe_sum).to_frame('Total Amount')
+        report_df = _expense_by_cat(data['expenses'][['Category', 'Amount (KES)']]).to_frame('Total Amount')
     elif report_type == "Payment Status Distribution":
-        report_df = data['contributions']['Status'].value_counts().to_frame('Households')
+        report_df = _status_counts(data['contributions']['Status']).set_index('Status').rename(columns={'Count': 'Households'})
     elif report_type == "Rate Category Analysis":
         if 'Rate Category' in data['contributions'].columns:
-            report_df = data['contributions'].groupby('Rate Category').agg({
-                'YTD': lambda x: safe_sum(x),
-                'House No': 'count'
-            }).rename(columns={'House No': 'Households'}).merge(
-                data['rates'].set_index('Rate Category'),
-                left_index=True, right_index=True
-            )
+            report_df = _rate_agg(contrib_slim[['Rate Category', 'YTD', 'House No']], data['rates_indexed'])
     elif report_type == "Special Contributions Analysis":
         if not data['special'].empty:
-            report_df = data['special'].groupby('Type')['Amount'].apply(safe_sum).to_frame('Total Amount')
+            report_df = _special_by_type(data['special'][['Type', 'Amount']]).to_frame('Total Amount')
 
     if report_df is not None:
-        output = io.BytesIO()
-        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-            report_df.to_excel(writer, sheet_name=report_type[:30])
         st.download_button(
             label="⬇️ Download Current Report",
-            data=output.getvalue(),
+            data=_build_xlsx(report_type, report_df),
             file_name=f"zawadi_{report_type.lower().replace(' ', '_')}.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            mime=XLSX_MIME
         )
 
     if st.session_state.get('treasurer_authenticated', False):
         st.subheader("📤 Full Data Export")
         export_options = st.multiselect(
             "Select data to export",
-            options=[
-                "Contributions Data", "Expenses Data", "Special Contributions",
-                "Rate Categories", "Expense Requests", "Contribution Requests", "Special Requests"
-            ],
+            options=list(CUSTOM_EXPORT_SHEETS),
             default=["Contributions Data", "Expenses Data", "Special Contributions"]
         )
 
         if st.button("🖨️ Generate Custom Report"):
-            with pd.ExcelWriter("zawadi_custom_report.xlsx") as writer:
-                if "Contributions Data" in export_options:
-                    data['contributions'].to_excel(writer, sheet_name="Contributions")
-                if "Expenses Data" in export_options:
-                    data['expenses'].to_excel(writer, sheet_name="Expenses")
-                if "Special Contributions" in export_options:
-                    data['special'].to_excel(writer, sheet_name="Special")
-                if "Rate Categories" in export_options and 'rates' in data:
-                    data['rates'].to_excel(writer, sheet_name="Rate Categories")
-                if "Expense Requests" in export_options and 'expense_requests' in data:
-                    data['expense_requests'].to_excel(writer, sheet_name="Expense Requests")
-                if "Contribution Requests" in export_options and 'contribution_requests' in data:
-                    data['contribution_requests'].to_excel(writer, sheet_name="Contribution Requests")
-                if "Special Requests" in export_options and 'special_requests' in data:
-                    data['special_requests'].to_excel(writer, sheet_name="Special Requests")
+            sheets = {
+                sheet_name: data[key]
+                for option, (key, sheet_name) in CUSTOM_EXPORT_SHEETS.items()
+                if option in export_options and key in data
+            }
+            # Build the workbook straight into memory; no temp file on disk.
+            # Sheets are coerced on worker threads while the main thread feeds xlsxwriter.
+            output = io.BytesIO()
+            with ThreadPoolExecutor(max_workers=4) as ex, \
+                    pd.ExcelWriter(output, engine='xlsxwriter') as writer:
+                prepared = {name: ex.submit(_prepare_sheet, df) for name, df in sheets.items()}
+                for sheet_name, fut in prepared.items():
+                    fut.result().to_excel(writer, sheet_name=sheet_name)
 
                 summary_df = pd.DataFrame({
                     'Metric': ['Total Regular Contributions', 'Total Expenses', 'Total Special Contributions'],
-                    'Amount (KES)': [
-                        safe_sum(data['contributions']['YTD']),
-                        safe_sum(data['expenses']['Amount (KES)']) if 'Amount (KES)' in data['expenses'].columns else 0,
-                        safe_sum(data['special']['Amount']) if 'Amount' in data['special'].columns else 0
-                    ]
+                    'Amount (KES)': [total_contributions, total_expenses, total_special]
                 })
                 summary_df.to_excel(writer, sheet_name="Summary", index=False)
 
-            with open("zawadi_custom_report.xlsx", "rb") as f:
-                st.download_button(
-                    "⬇️ Download Custom Report",
-                    f,
-                    "zawadi_custom_report.xlsx",
-                    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                )
+            st.download_button(
+                "⬇️ Download Custom Report",
+                output.getvalue(),
+                "zawadi_custom_report.xlsx",
+                XLSX_MIME
+            )
 
 # =========================
 # Tests (unchanged)
@@ -1578,6 +1746,28 @@ class TestZawadiFunctions(unittest.TestCase):
         self.assertEqual(calculate_ytd(test_row, 'FEB'), 3000)
         self.assertEqual(calculate_ytd(test_row, 'APR'), 6000)
 
+    def test_contribution_metrics(self):
+        contrib = pd.DataFrame({
+            'Rate Category': ['Resident', 'Non-Resident', None],
+            'Cumulative Debt (2024 & Prior)': [0, '1,000', 0],
+            **{m: [2000, 0, 0] for m in MONTHS},
+        })
+        contrib['FEB'] = ['2,000', 1000, 0]
+        rates = pd.DataFrame({'Rate Category': ['Resident', 'Non-Resident'], 'Amount': [2000, 1000]})
+        metrics = contribution_metrics(contrib, 'MAR', rates)
+        for i, row in contrib.iterrows():
+            self.assertEqual(metrics.loc[i, 'YTD'], calculate_ytd(row, 'MAR'))
+            self.assertEqual(metrics.loc[i, 'Current Debt'], calculate_current_debt(row, 'MAR', rates))
+            self.assertEqual(metrics.loc[i, 'Status'], get_payment_status(row, 'MAR', rates))
+
+    def test_sum_by_month(self):
+        dates = pd.to_datetime(pd.Series(['2025-01-05', 'not a date', '2025-03-10', '2025-01-20']), errors='coerce')
+        totals = sum_by_month(pd.Series([100, 50, '25', 200]), dates)
+        self.assertEqual(list(totals.index), MONTHS)
+        self.assertEqual(totals['JAN'], 300)
+        self.assertEqual(totals['FEB'], 0)
+        self.assertEqual(totals['MAR'], 25)
+
     @patch('pandas.read_csv')
     def test_load_data(self, mock_read_csv):
         # Deprecated in Postgres mode, but keep a simple smoke test
@@ -1596,6 +1786,14 @@ class TestZawadiFunctions(unittest.TestCase):
 # =========================
 # App entry
 # =========================
+@st.cache_data(ttl=300, show_spinner=False)
+def _house_index(house_nos: pd.Series) -> dict:
+    """Map House No (as str) -> row label, so the admin editor looks rows up in O(1).
+    A repeated House No maps to its first row, as the old .iloc[0] lookup did."""
+    keys = house_nos.astype(str)
+    keys = keys[~keys.duplicated(keep='first')]
+    return dict(zip(keys.tolist(), keys.index))
+
 def main():
     # Sidebar offline banner + retry
     if st.session_state.get('_offline', False):
@@ -1604,10 +1802,16 @@ def main():
             if st.button("🔄 Retry DB connection"):
                 retry_connection()
 
+    if st.sidebar.button("🔄 Refresh data", key="refresh_data_btn"):
+        _cached_load.clear()
+
     data = load_data()
     # Ensure contributions has all expected columns
     if 'contributions' in data:
         data['contributions'] = ensure_contributions_columns(data['contributions'])
+    # Rates keyed by category once per load, so report joins skip the re-index
+    if 'rates' in data:
+        data['rates_indexed'] = data['rates'].set_index('Rate Category')
 
     cm_df = data.get('cash_management')
     if isinstance(cm_df, pd.DataFrame) and not cm_df.empty:
@@ -1637,24 +1841,19 @@ def main():
                 )
                 st.success("Test email sent!") if ok else st.error("Send failed")
 
+    pages = ["Contributions Dashboard", "Expense Tracker", "Special Contributions", "Reports"]
+    if st.session_state.get('treasurer_authenticated', False):
+        pages.append("Residency Management")
+
     if is_mobile():
         with st.sidebar.expander("Menu", expanded=True):
-            page = st.radio(
-                "Navigation",
-                ["Contributions Dashboard", "Expense Tracker", "Special Contributions", "Reports"],
-                index=0
-            )
+            page = st.radio("Navigation", pages, index=0, key="nav_page")
     else:
-        page = st.sidebar.radio(
-            "Navigation",
-            ["Contributions Dashboard", "Expense Tracker", "Special Contributions", "Reports"],
-            index=0
-        )
+        page = st.sidebar.radio("Navigation", pages, index=0, key="nav_page")
 
-    if st.session_state.get('treasurer_authenticated', False):
+    if page == "Residency Management":
         residency_management(data)
-
-    if page == "Contributions Dashboard":
+    elif page == "Contributions Dashboard":
         contributions_dashboard(data)
     elif page == "Expense Tracker":
         expense_tracker(data)
@@ -1668,6 +1867,8 @@ def main():
         st.markdown("---")
         st.subheader("🛠️ Admin: Edit / Delete (Treasurer)")
 
+        # The frames below are read-only views of `data`; any change must go
+        # through the update_*/delete_* DB helpers, never in place on data[...].
         admin_tabs = st.tabs([
             "Households (Contributions)",
             "Requests & Expenses",
@@ -1676,19 +1877,20 @@ def main():
 
         # --- Households (Contributions) ---
         with admin_tabs[0]:
-            df = data.get('contributions', pd.DataFrame()).copy()
+            df = data.get('contributions', pd.DataFrame())
             if df.empty:
                 st.info("No households found.")
             else:
+                hn_index = _house_index(df["House No"])
                 left, right = st.columns([1, 2])
                 with left:
                     hn = st.selectbox(
                         "Select House No",
-                        options=df["House No"].astype(str).tolist(),
+                        options=list(hn_index),
                         index=0,
                     )
 
-                row = df.loc[df["House No"].astype(str) == str(hn)].iloc[0].copy()
+                row = df.loc[hn_index[str(hn)]].copy()
 
                 with right:
                     st.markdown("**Edit selected household**")
@@ -1732,6 +1934,7 @@ def main():
                                     remarks=remarks,
                                 )
                                 st.success(f"Updated household {hn}.")
+                                _cached_load.clear()
                                 st.rerun()
                             except Exception as e:
                                 st.error(f"Update failed: {e}")
@@ -1741,25 +1944,27 @@ def main():
                             try:
                                 delete_contributions_by_house([str(hn)])
                                 st.success(f"Deleted household {hn} and related pending requests.")
+                                _cached_load.clear()
                                 st.rerun()
                             except Exception as e:
                                 st.error(f"Delete failed: {e}")
 
         # --- Requests & Expenses ---
         with admin_tabs[1]:
-            c_req = data.get('contribution_requests', pd.DataFrame()).copy()
-            e_req = data.get('expense_requests', pd.DataFrame()).copy()
-            exp   = data.get('expenses', pd.DataFrame()).copy()
+            c_req = data.get('contribution_requests', pd.DataFrame())
+            e_req = data.get('expense_requests', pd.DataFrame())
+            exp   = data.get('expenses', pd.DataFrame())
 
             st.markdown("**Contribution Requests**")
             if c_req.empty:
                 st.caption("None.")
             else:
-                ids = st.multiselect("Select request IDs to delete", c_req["id"].astype(int).tolist(), [])
+                ids = st.multiselect("Select request IDs to delete", c_req["id"].to_numpy().tolist(), [])
                 if st.button("🗑️ Delete Selected Contribution Requests"):
                     try:
                         delete_contribution_requests([int(i) for i in ids])
                         st.success(f"Deleted {len(ids)} contribution request(s).")
+                        _cached_load.clear()
                         st.rerun()
                     except Exception as e:
                         st.error(f"Delete failed: {e}")
@@ -1768,11 +1973,12 @@ def main():
             if e_req.empty:
                 st.caption("None.")
             else:
-                ids = st.multiselect("Select expense-request IDs to delete", e_req["id"].astype(int).tolist(), key="exp_req_ids")
+                ids = st.multiselect("Select expense-request IDs to delete", e_req["id"].to_numpy().tolist(), key="exp_req_ids")
                 if st.button("🗑️ Delete Selected Expense Requests"):
                     try:
                         delete_expense_requests([int(i) for i in ids])
                         st.success(f"Deleted {len(ids)} expense request(s).")
+                        _cached_load.clear()
                         st.rerun()
                     except Exception as e:
                         st.error(f"Delete failed: {e}")
@@ -1785,19 +1991,20 @@ def main():
                 if 'id' not in exp.columns:
                     st.info("Expenses table has no 'id' column; delete by ID is unavailable.")
                 else:
-                    ids = st.multiselect("Select expense IDs to delete", exp["id"].astype(int).tolist(), key="exp_ids")
+                    ids = st.multiselect("Select expense IDs to delete", exp["id"].to_numpy().tolist(), key="exp_ids")
                     if st.button("🗑️ Delete Selected Expenses"):
                         try:
                             delete_expenses([int(i) for i in ids])
                             st.success(f"Deleted {len(ids)} expense(s).")
+                            _cached_load.clear()
                             st.rerun()
                         except Exception as e:
                             st.error(f"Delete failed: {e}")
 
         # --- Special Events ---
         with admin_tabs[2]:
-            sp  = data.get('special', pd.DataFrame()).copy()
-            spr = data.get('special_requests', pd.DataFrame()).copy()
+            sp  = data.get('special', pd.DataFrame())
+            spr = data.get('special_requests', pd.DataFrame())
 
             st.markdown("**Special Contributions**")
             if sp.empty:
@@ -1806,11 +2013,12 @@ def main():
                 if 'id' not in sp.columns:
                     st.info("Special table has no 'id' column; delete by ID is unavailable.")
                 else:
-                    ids = st.multiselect("Select special IDs to delete", sp["id"].astype(int).tolist(), key="sp_ids")
+                    ids = st.multiselect("Select special IDs to delete", sp["id"].to_numpy().tolist(), key="sp_ids")
                     if st.button("🗑️ Delete Selected Special"):
                         try:
                             delete_special([int(i) for i in ids])
                             st.success(f"Deleted {len(ids)} special record(s).")
+                            _cached_load.clear()
                             st.rerun()
                         except Exception as e:
                             st.error(f"Delete failed: {e}")
@@ -1822,11 +2030,12 @@ def main():
                 if 'id' not in spr.columns:
                     st.info("Special Requests table has no 'id' column; delete by ID is unavailable.")
                 else:
-                    ids = st.multiselect("Select special-request IDs to delete", spr["id"].astype(int).tolist(), key="spr_ids")
+                    ids = st.multiselect("Select special-request IDs to delete", spr["id"].to_numpy().tolist(), key="spr_ids")
                     if st.button("🗑️ Delete Selected Special Requests"):
                         try:
                             delete_special_requests([int(i) for i in ids])
                             st.success(f"Deleted {len(ids)} special request(s).")
+                            _cached_load.clear()
                             st.rerun()
                         except Exception as e:
                             st.error(f"Delete failed: {e}")
@@ -1839,7 +2048,7 @@ def main():
                     st.success("Backup created successfully in 'backups' directory!")
                 else:
                     st.error("Backup failed")
-            backups = sorted(glob.glob(os.path.join(BACKUP_DIR, 'backup_*')), reverse=True)
+            backups = _recent_backups()
             if backups:
                 st.write("Available Backups:")
                 selected_backup = st.selectbox(
@@ -1869,20 +2078,13 @@ def main():
                 try:
                     temp = {}
                     for file in uploaded_file:
-                        if 'contributions' in file.name.lower():
-                            temp['contributions'] = pd.read_csv(file)
-                        elif 'expenses' in file.name.lower():
-                            temp['expenses'] = pd.read_csv(file)
-                        elif 'special' in file.name.lower():
-                            temp['special'] = pd.read_csv(file)
-                        elif 'rates' in file.name.lower():
-                            temp['rates'] = pd.read_csv(file)
-                        elif 'expense_requests' in file.name.lower():
-                            temp['expense_requests'] = pd.read_csv(file)
-                        elif 'contribution_requests' in file.name.lower():
-                            temp['contribution_requests'] = pd.read_csv(file)
-                        elif 'special_requests' in file.name.lower():
-                            temp['special_requests'] = pd.read_csv(file)
+                        name = file.name.lower()
+                        for tag, key in RESTORE_FILE_TAGS.items():
+                            if tag in name:
+                                # Arrow's multithreaded parser; columns come back as NumPy dtypes
+                                # so the Sheets backup's fillna("") still works on them
+                                temp[key] = pd.read_csv(file, engine='pyarrow')
+                                break
                     if temp:
                         save_data(temp)
                     st.success("Data restored successfully from uploaded files!")
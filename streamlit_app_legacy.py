@@ -1,10 +1,12 @@
 # streamlit_app.py
 import os
+import time
 import datetime as dt
+from contextlib import contextmanager
 import pandas as pd
 import streamlit as st
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool
 from dotenv import load_dotenv, find_dotenv
 
 # ---------- Env & DB ----------
@@ -19,31 +21,121 @@ DSN = dict(
     sslmode=os.getenv("PGSSLMODE", "require"),
 )
 
-def fetch_df(sql, params=None):
-    with psycopg2.connect(**DSN) as conn:
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute(sql, params or ())
-            rows = cur.fetchall()
-    return pd.DataFrame(rows)
+@st.cache_resource
+def get_pool():
+    """One connection pool per process, shared by every rerun/session."""
+    return ThreadedConnectionPool(minconn=1, maxconn=8, **DSN)
+
+# Seconds a pooled connection may sit unused before checkout pings it first
+IDLE_PING_S = 30
+
+@st.cache_resource
+def _last_used_times() -> dict:
+    """id(conn) -> monotonic time of its last checkin; cached so it lives as long as the pool."""
+    return {}
+
+_last_used = _last_used_times()
+
+def _checkout(pool):
+    """Same idle-ping checkout as zawadi_db._checkout, for this console's non-autocommit connections."""
+    last_err = None
+    for _ in range(3):
+        conn = pool.getconn()
+        last = _last_used.get(id(conn))
+        if last is None or time.monotonic() - last < IDLE_PING_S:
+            return conn
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()  # don't hand out the ping's open transaction
+            return conn
+        except psycopg2.Error as e:
+            last_err = e
+            _last_used.pop(id(conn), None)
+            pool.putconn(conn, close=True)
+    raise last_err
+
+@contextmanager
+def pooled_conn():
+    """Borrow a pooled connection; commit on success, roll back on error, always return it."""
+    pool = get_pool()
+    conn = _checkout(pool)
+    try:
+        yield conn
+        conn.commit()
+    except Exception:
+        if not conn.closed:
+            conn.rollback()
+        raise
+    finally:
+        # drop connections the server already closed instead of recycling them
+        pool.putconn(conn, close=bool(conn.closed))
+        if conn.closed:
+            _last_used.pop(id(conn), None)
+        else:
+            _last_used[id(conn)] = time.monotonic()
+
+def _frame(cur):
+    """Build a DataFrame straight from row tuples, column names taken from cur.description."""
+    return pd.DataFrame.from_records(cur.fetchall(), columns=[c.name for c in cur.description])
+
+def fetch_many(sqls):
+    """Run several read-only SELECTs on one pooled connection; one DataFrame per query."""
+    try:
+        return _fetch_many_once(sqls)
+    except psycopg2.OperationalError:
+        # connection dropped under us; it has been discarded, so one retry gets a fresh one
+        return _fetch_many_once(sqls)
+
+def _fetch_many_once(sqls):
+    frames = []
+    with pooled_conn() as conn:
+        with conn.cursor() as cur:
+            for sql in sqls:
+                cur.execute(sql)
+                frames.append(_frame(cur))
+    return frames
+
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_many_cached(sqls: tuple):
+    """fetch_many() for the dashboard reads; cleared after every write."""
+    return fetch_many(sqls)
 
 def execute(sql, params=None):
-    with psycopg2.connect(**DSN) as conn:
+    """Run one statement in its own transaction; returns the first row when it has RETURNING."""
+    with pooled_conn() as conn:
         with conn.cursor() as cur:
             cur.execute(sql, params or ())
-        conn.commit()
+            return cur.fetchone() if cur.description else None
 
 # ---------- UI ----------
 st.set_page_config(page_title="Zawadi Court — Treasurer", page_icon="🏠", layout="wide")
 st.title("🏠 Zawadi Court — Treasurer Console")
 
-# Totals
-totals = fetch_df("""
+# Totals + recent records, read together over one connection
+totals, df_exp, df_con = fetch_many_cached((
+    """
     select
       (select coalesce(sum(amount_kes),0) from expenses)              as total_expenses_kes,
       (select coalesce(sum(current_debt),0) from contributions)       as total_current_debt_kes,
       (select coalesce(max(cash_balance_cd),0) from cash_management)  as cash_balance_cd,
       (select coalesce(max(cash_withdrawal),0)  from cash_management) as cash_withdrawal
-""")
+    """,
+    """
+    select id, "date", description, category, vendor, amount_kes, mode, remarks
+    from expenses
+    order by "date" desc, id desc
+    limit 20
+    """,
+    """
+    select house_no, family_name, lane, rate_category,
+           ytd, current_debt, jan, feb, mar, apr, may, jun,
+           jul, aug, sep, oct, nov, dec, updated_at
+    from contributions
+    order by updated_at desc nulls last
+    limit 20
+    """,
+))
 
 c1, c2, c3, c4 = st.columns(4)
 if not totals.empty:
@@ -58,21 +150,6 @@ tab1, tab2 = st.tabs(["📜 Recent records", "➕ Add expense"])
 
 with tab1:
     colA, colB = st.columns(2)
-    # Recent expenses
-    df_exp = fetch_df("""
-        select id, "date", description, category, vendor, amount_kes, mode, remarks
-        from expenses
-        order by "date" desc, id desc
-        limit 20
-    """)
-    df_con = fetch_df("""
-        select house_no, family_name, lane, rate_category,
-               ytd, current_debt, jan, feb, mar, apr, may, jun,
-               jul, aug, sep, oct, nov, dec, updated_at
-        from contributions
-        order by updated_at desc nulls last
-        limit 20
-    """)
     with colA:
         st.subheader("Recent expenses")
         st.dataframe(df_exp, use_container_width=True, hide_index=True)
@@ -100,11 +177,13 @@ with tab2:
                 st.error("Please provide at least a description and a positive amount.")
             else:
                 try:
-                    execute("""
+                    (new_id,) = execute("""
                         insert into expenses("date", description, category, vendor, phone, amount_kes, mode, remarks)
                         values (%s,%s,%s,%s,%s,%s,%s,%s)
+                        returning id
                     """, (date_val, description.strip(), category.strip(), vendor.strip(),
                           phone.strip(), float(amount), mode.strip(), remarks.strip()))
-                    st.success("Expense saved.")
+                    fetch_many_cached.clear()
+                    st.success(f"Expense #{new_id} saved.")
                 except Exception as e:
                     st.error(f"Failed to save expense: {e}")
@@ -0,0 +1,127 @@
+import datetime
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import zawadi_db
+from zawadi_db import _household_copy_buffer
+
+
+def _staged(df):
+    return _household_copy_buffer(df).getvalue().splitlines()
+
+
+def test_household_copy_missing_email_is_null():
+    df = pd.DataFrame({
+        "House No": ["H-01", "H-02", "H-03"],
+        "Rate Category": ["Resident", np.nan, "Standard"],
+        "Email": [np.nan, "k@x", ""],
+    })
+    # \N is NULL in COPY text format; an empty field stays ''
+    assert _staged(df) == ["H-01\tResident\t\\N", "H-02\t\\N\tk@x", "H-03\tStandard\t"]
+
+
+def test_household_copy_missing_email_none():
+    df = pd.DataFrame({"House No": ["H-01"], "Rate Category": ["Resident"], "Email": [None]}, dtype=object)
+    assert _staged(df) == ["H-01\tResident\t\\N"]
+
+
+def test_household_copy_escapes_and_last_edit_wins():
+    df = pd.DataFrame({
+        "House No": ["H-01", "H-01"],
+        "Rate Category": ["Resident", "Standard"],
+        "Email": ["a@x", "b\tc\\d\ne"],
+    })
+    assert _staged(df) == ["H-01\tStandard\tb\\tc\\\\d\\ne"]
+
+
+def test_household_copy_without_email_column():
+    df = pd.DataFrame({"House No": ["H-01"], "Rate Category": ["Resident"]})
+    assert _staged(df) == ["H-01\tResident\t"]
+
+
+def test_household_copy_empty():
+    assert _household_copy_buffer(pd.DataFrame({"House No": [], "Rate Category": []})) is None
+
+
+def _undefined_column():
+    from sqlalchemy.exc import ProgrammingError
+
+    class UndefinedColumn(Exception):
+        pass
+
+    try:
+        try:
+            raise UndefinedColumn('column "status" does not exist')
+        except UndefinedColumn as orig:
+            raise ProgrammingError("SELECT ...", {}, orig) from orig
+    except ProgrammingError as e:
+        return e
+
+
+def _wrapped_by_pandas(err):
+    try:
+        raise pd.errors.DatabaseError("Execution failed on sql 'SELECT ...'") from err
+    except pd.errors.DatabaseError as e:
+        return e
+
+
+@pytest.mark.parametrize("shape", ["sqlalchemy", "pandas"])
+def test_fetch_contributions_falls_back_on_schema_mismatch(monkeypatch, shape):
+    err = _undefined_column()
+    if shape == "pandas":
+        err = _wrapped_by_pandas(err)
+    calls = []
+
+    def fake_read_sql(sql, params=None, conn=None):
+        calls.append(sql)
+        if len(calls) == 1:
+            raise err
+        return pd.DataFrame({"house_no": ["H-01"], "family_name": ["Achieng"]})
+
+    conn = MagicMock()
+    monkeypatch.setattr(zawadi_db, "_read_sql", fake_read_sql)
+    monkeypatch.setattr(zawadi_db, "_table_columns", lambda table, conn=None: frozenset({"house_no", "family_name"}))
+
+    df = zawadi_db.fetch_contributions(conn)
+
+    conn.rollback.assert_called_once()
+    assert calls[1].startswith("SELECT house_no, family_name FROM public.contributions")
+    assert list(df.columns) == ["House No", "Family Name"]
+
+
+def test_fetch_contributions_reraises_other_errors(monkeypatch):
+    err = _wrapped_by_pandas(RuntimeError("connection reset"))
+
+    def fake_read_sql(sql, params=None, conn=None):
+        raise err
+
+    monkeypatch.setattr(zawadi_db, "_read_sql", fake_read_sql)
+    with pytest.raises(pd.errors.DatabaseError):
+        zawadi_db.fetch_contributions(MagicMock())
+
+
+def test_fetch_small_tables_null_date_is_none():
+    payload = {
+        "rates": [],
+        "expense_requests": [
+            {"id": 2, "date": None, "description": "x", "category": None, "requested_by": "a",
+             "amount_kes": 10.0, "status": "Pending Approval", "remarks": None},
+            {"id": 1, "date": "2026-02-01", "description": "y", "category": None, "requested_by": "b",
+             "amount_kes": 5.0, "status": "Pending Approval", "remarks": None},
+        ],
+        "contribution_requests": [],
+        "special_requests": [],
+        "cash_management": None,
+    }
+    conn = MagicMock()
+    conn.execute.return_value.scalar_one.return_value = payload
+
+    out = zawadi_db.fetch_small_tables(conn)
+
+    dates = out["expense_requests"]["Date"].tolist()
+    assert dates[0] is None
+    assert dates[1] == datetime.date(2026, 2, 1)
+    assert out["contribution_requests"]["Date"].tolist() == []
@@ -2,19 +2,23 @@
 
 # --- imports (put at very top of zawadi_db.py) ---
 import os
+import io
 import json
-import time  # ✅ used in _engine() tiny backoff
+import time  # ✅ used in _connect() tiny backoff
 from datetime import datetime
 
 import pandas as pd
 from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import NullPool
 from sqlalchemy.exc import OperationalError, ProgrammingError
 from contextlib import contextmanager  # ✅ needed for @contextmanager
 
 # ✅ missing previously
 import psycopg2
-from psycopg2.extras import RealDictCursor
+import psycopg2.errors
+from psycopg2.extras import execute_values
+from psycopg2.pool import ThreadedConnectionPool
 
 def _build_candidate_urls():
     """
@@ -54,31 +58,71 @@ def _build_candidate_urls():
 
     return [add_params(u) for u in urls]
 
-def _engine() -> Engine:
+def _engine_kwargs(url: str) -> dict:
+    """create_engine options tuned for Supabase's poolers."""
+    kwargs = {"pool_pre_ping": True, "pool_recycle": 180}
+    if ":6543/" in url:
+        # Transaction pooler: it already pools server connections, so don't hold our own
+        kwargs["poolclass"] = NullPool
+    else:
+        # Session pooler / direct: small pool, Supabase caps client connections per project
+        kwargs.update(pool_size=3, max_overflow=2, pool_timeout=30)
+    if make_url(url).get_driver_name() == "psycopg":
+        # psycopg 3 prepares repeated statements server-side, which transaction pooling breaks
+        kwargs["connect_args"] = {"prepare_threshold": None}
+    return kwargs
+
+# One Engine (and so one connection pool) per candidate URL for the whole process
+_ENGINE_CACHE: dict[str, Engine] = {}
+
+def _engine(url: str) -> Engine:
+    eng = _ENGINE_CACHE.get(url)
+    if eng is None:
+        # create_engine is lazy: nothing connects until the first checkout
+        eng = _ENGINE_CACHE.setdefault(url, create_engine(url, **_engine_kwargs(url)))
+    return eng
+
+def _connect():
+    """
+    Check out a read connection, trying each candidate URL with a tiny backoff.
+    No separate reachability probe: the connection returned is the one the query runs on,
+    and pool_pre_ping re-validates pooled connections on later checkouts.
+    """
     urls = _build_candidate_urls()
     if not urls:
         raise RuntimeError("DATABASE_URL not set")
 
     last_err = None
-    for idx, url in enumerate(urls, start=1):
-        for attempt, delay in enumerate([0.2, 0.4, 0.8], start=1):
+    for url in urls:
+        eng = _engine(url)
+        for delay in [0.2, 0.4, 0.8]:
             try:
-                eng = create_engine(url, pool_pre_ping=True, pool_recycle=180)
-                # quick probe with a very short connection to validate reachability
-                with eng.connect() as _:
-                    pass
-                return eng
+                return eng.connect()
             except OperationalError as e:
                 last_err = e
                 time.sleep(delay)
-                continue
     # If all candidates failed, raise the last error
     raise last_err or RuntimeError("No working DB URL")
 
-def _read_sql(sql, params=None):
-    eng = _engine()
-    with eng.connect() as conn:
-        return pd.read_sql(sql, conn, params=params)
+# Rows per fetch from the server-side cursor; bounds peak memory as the ledgers grow
+_READ_CHUNK_ROWS = 10_000
+
+def _read_sql(sql, params=None, conn=None):
+    """
+    Run a SELECT into a DataFrame, on `conn` when the caller already holds one.
+    Results are streamed in _READ_CHUNK_ROWS pieces rather than buffered whole client-side.
+    """
+    if conn is None:
+        with _connect() as conn:
+            return _read_sql(sql, params, conn)
+    chunks = list(pd.read_sql(
+        sql, conn.execution_options(stream_results=True),
+        params=params, chunksize=_READ_CHUNK_ROWS,
+    ))
+    if len(chunks) == 1:
+        return chunks[0]
+    # a chunk whose column is all NULL comes back object; re-infer so dtypes match a one-shot read
+    return pd.concat(chunks, ignore_index=True).infer_objects()
 
 # ---------------------------------------------------------------------
 # psycopg2 connection for WRITES/EXEC
@@ -94,171 +138,265 @@ def _current_pg_env():
         "PGSSLMODE": os.getenv("PGSSLMODE", "require"),
     }
 
+# Write connections are pooled per DSN and reused across _exec calls
+_WRITE_POOLS: dict = {}
+
+def _write_pool() -> ThreadedConnectionPool:
+    """
+    Lazily create the write pool for the current settings.
+    Uses DATABASE_URL if present; else discrete PG* vars.
+    """
+    env = _current_pg_env()
+    if env["DATABASE_URL"]:
+        conn_kwargs = {"dsn": env["DATABASE_URL"]}
+    else:
+        if not env["PGHOST"]:
+            raise RuntimeError("PGHOST is not set (and no DATABASE_URL).")
+        conn_kwargs = {
+            "host": env["PGHOST"],
+            "dbname": env["PGDATABASE"],
+            "user": env["PGUSER"],
+            "password": env["PGPASSWORD"],
+            "port": env["PGPORT"],
+            "sslmode": env["PGSSLMODE"],
+        }
+    key = tuple(sorted(conn_kwargs.items()))
+    pool = _WRITE_POOLS.get(key)
+    if pool is None:
+        pool = ThreadedConnectionPool(
+            1, 5, connect_timeout=10, **conn_kwargs
+        )
+        pool = _WRITE_POOLS.setdefault(key, pool)
+    return pool
+
+# Write connections idle longer than this are pinged before reuse; the pooler may have dropped them
+_IDLE_PING_S = 30
+_LAST_USED: dict[int, float] = {}  # id(conn) -> monotonic time it was handed back
+
+def _checkout(pool):
+    """
+    Borrow a live connection. Recently used ones are trusted as-is; ones idle past _IDLE_PING_S
+    must answer a ping, and dead ones (idle-dropped by the server) are discarded.
+    """
+    last_err = None
+    for _ in range(3):
+        conn = pool.getconn()
+        try:
+            # autocommit to avoid lingering transactions on simple writes
+            conn.autocommit = True
+            last = _LAST_USED.get(id(conn))
+            if last is not None and time.monotonic() - last >= _IDLE_PING_S:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT 1")
+            return conn
+        except psycopg2.Error as e:
+            last_err = e
+            _LAST_USED.pop(id(conn), None)
+            pool.putconn(conn, close=True)
+    raise last_err
+
 @contextmanager
 def _conn():
     """
-    Open a PostgreSQL connection for write ops.
-    Uses DATABASE_URL if present; else discrete PG* vars.
+    Borrow a pooled PostgreSQL connection for write ops.
     When unreachable, raises a friendly RuntimeError for UI to show "Write disabled in offline mode".
     """
-    env = _current_pg_env()
+    pool = conn = None
     try:
-        if env["DATABASE_URL"]:
-            conn = psycopg2.connect(
-                env["DATABASE_URL"],
-                cursor_factory=RealDictCursor,
-                connect_timeout=10,
-            )
-        else:
-            if not env["PGHOST"]:
-                raise RuntimeError("PGHOST is not set (and no DATABASE_URL).")
-            conn = psycopg2.connect(
-                host=env["PGHOST"],
-                dbname=env["PGDATABASE"],
-                user=env["PGUSER"],
-                password=env["PGPASSWORD"],
-                port=env["PGPORT"],
-                sslmode=env["PGSSLMODE"],
-                cursor_factory=RealDictCursor,
-                connect_timeout=10,
-            )
-        # optional: enable autocommit to avoid lingering transactions on simple writes
-        conn.autocommit = True
+        pool = _write_pool()
+        conn = _checkout(pool)
         yield conn
     except Exception as e:
         # Convert any connection error into a single friendly message for the UI layer
         raise RuntimeError("Write disabled in offline mode") from e
     finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
+        if conn is not None:
+            pool.putconn(conn, close=bool(conn.closed))
+            if conn.closed:
+                _LAST_USED.pop(id(conn), None)
+            else:
+                _LAST_USED[id(conn)] = time.monotonic()
 
 def _exec(sql, params=None, return_df=False):
     with _conn() as conn:
         with conn.cursor() as cur:
             cur.execute(sql, params or {})
             if return_df:
-                rows = cur.fetchall()
-                return pd.DataFrame(rows)
+                # plain tuple rows; column names come from the cursor description
+                return pd.DataFrame.from_records(cur.fetchall(), columns=[c.name for c in cur.description])
         # autocommit=True above; explicit commit only if you later disable it
         # conn.commit()
 
 # ---------------------------------------------------------------------
 # READ helpers
 # ---------------------------------------------------------------------
-def fetch_contributions():
-    cols = ["house_no","family_name","lane","rate_category","email",
-            "cumulative_debt_prior","jan","feb","mar","apr","may","jun","jul","aug","sep","oct","nov","dec",
-            "ytd","current_debt","status","remarks","updated_at"]
+# Schema rarely changes; remember each table's columns for a few minutes
+_COLUMNS_TTL_S = 300
+_TABLE_COLUMNS: dict[str, tuple[float, frozenset]] = {}
+
+def _table_columns(table, conn=None) -> frozenset:
+    """Column names of public.<table> (empty if it doesn't exist yet), cached for _COLUMNS_TTL_S."""
+    now = time.monotonic()
+    hit = _TABLE_COLUMNS.get(table)
+    if hit is not None and now - hit[0] < _COLUMNS_TTL_S:
+        return hit[1]
     present = _read_sql("""
         SELECT column_name FROM information_schema.columns
-        WHERE table_schema='public' AND table_name='contributions'
-    """)
-    keep = [c for c in cols if c in present["column_name"].tolist()]
+        WHERE table_schema='public' AND table_name=%(table)s
+    """, params={"table": table}, conn=conn)
+    cols = frozenset(present["column_name"])
+    _TABLE_COLUMNS[table] = (now, cols)
+    return cols
+
+# Column renames: snake_case DB columns -> dashboard headers (pandas skips missing keys)
+_CONTRIB_RENAME: dict[str, str] = {
+    "house_no":"House No","family_name":"Family Name","lane":"Lane","rate_category":"Rate Category",
+    "email":"Email","cumulative_debt_prior":"Cumulative Debt (2024 & Prior)",
+    "jan":"JAN","feb":"FEB","mar":"MAR","apr":"APR","may":"MAY","jun":"JUN","jul":"JUL",
+    "aug":"AUG","sep":"SEP","oct":"OCT","nov":"NOV","dec":"DEC",
+    "ytd":"YTD","current_debt":"Current Debt","status":"Status","remarks":"Remarks"
+}
+_EXPENSE_RENAME: dict[str, str] = {
+    "date":"Date","description":"Description","category":"Category","vendor":"Vendor",
+    "phone":"Phone","amount_kes":"Amount (KES)","mode":"Mode","remarks":"Remarks"
+}
+_RATES_RENAME: dict[str, str] = {"rate_category":"Rate Category","amount":"Amount"}
+_EXPENSE_REQ_RENAME: dict[str, str] = {
+    "date":"Date","description":"Description","category":"Category","requested_by":"Requested By",
+    "amount_kes":"Amount (KES)","status":"Status","remarks":"Remarks"
+}
+_CONTRIB_REQ_RENAME: dict[str, str] = {
+    "date":"Date","month":"Month","family_name":"Family Name","house_no":"House No","lane":"Lane",
+    "rate_category":"Rate Category","amount_kes":"Amount (KES)","status":"Status","remarks":"Remarks"
+}
+_SPECIAL_RENAME: dict[str, str] = {
+    "event":"Event","date":"Date","type":"Type","contributors":"Contributors",
+    "amount":"Amount","remarks":"Remarks"
+}
+_SPECIAL_REQ_RENAME: dict[str, str] = {
+    "date":"Date","requested_by":"Requested By",
+    "amount":"Amount","status":"Status","event":"Event","type":"Type"
+}
+_CASH_RENAME: dict[str, str] = {
+    "cash_balance_cd":"Cash Balance c/d",
+    "cash_withdrawal":"Cash Withdrawal"
+}
+
+_CONTRIB_COLS = ["house_no","family_name","lane","rate_category","email",
+                 "cumulative_debt_prior","jan","feb","mar","apr","may","jun","jul","aug","sep","oct","nov","dec",
+                 "ytd","current_debt","status","remarks","updated_at"]
+_CONTRIB_ORDER = "ORDER BY updated_at DESC NULLS LAST, family_name ASC"
+
+def fetch_contributions(conn=None):
+    if conn is None:
+        with _connect() as conn:
+            return fetch_contributions(conn)
+    # The canonical column list is what init_db.py creates: one query in the normal case
+    try:
+        df = _read_sql(f"SELECT {', '.join(_CONTRIB_COLS)} FROM public.contributions {_CONTRIB_ORDER}", conn=conn)
+        return df.rename(columns=_CONTRIB_RENAME)
+    except (ProgrammingError, pd.errors.DatabaseError) as e:
+        # pandas 3 wraps driver errors in its own DatabaseError, pandas 2 lets SQLAlchemy's through;
+        # only schema mismatches fall through
+        if not (isinstance(e, ProgrammingError) or isinstance(e.__cause__, ProgrammingError)):
+            raise
+        # missing table, or an older schema lacking some columns (e.g. db/schema.sql): probe and select what exists
+        conn.rollback()
+
+    present = _table_columns("contributions", conn=conn)
+    keep = [c for c in _CONTRIB_COLS if c in present]
     if not keep:
         # table doesn't exist / no columns yet
-        return pd.DataFrame(columns=[
-            "House No","Family Name","Lane","Rate Category","Email",
-            "Cumulative Debt (2024 & Prior)","JAN","FEB","MAR","APR","MAY","JUN","JUL",
-            "AUG","SEP","OCT","NOV","DEC","YTD","Current Debt","Status","Remarks"
-        ])
-
-    q = f"SELECT {', '.join(keep)} FROM public.contributions ORDER BY updated_at DESC NULLS LAST, family_name ASC"
-    df = _read_sql(q)
-    rename = {
-        "house_no":"House No","family_name":"Family Name","lane":"Lane","rate_category":"Rate Category",
-        "email":"Email","cumulative_debt_prior":"Cumulative Debt (2024 & Prior)",
-        "jan":"JAN","feb":"FEB","mar":"MAR","apr":"APR","may":"MAY","jun":"JUN","jul":"JUL",
-        "aug":"AUG","sep":"SEP","oct":"OCT","nov":"NOV","dec":"DEC",
-        "ytd":"YTD","current_debt":"Current Debt","status":"Status","remarks":"Remarks"
-    }
-    return df.rename(columns={k: v for k, v in rename.items() if k in df.columns})
+        return pd.DataFrame(columns=list(_CONTRIB_RENAME.values()))
+
+    df = _read_sql(f"SELECT {', '.join(keep)} FROM public.contributions {_CONTRIB_ORDER}", conn=conn)
+    return df.rename(columns=_CONTRIB_RENAME)
 
-def fetch_expenses():
+def fetch_expenses(conn=None):
     df = _read_sql("""
         SELECT id, date, description, category, vendor, phone, amount_kes, mode, remarks
         FROM public.expenses
         ORDER BY date DESC, id DESC
-    """)
-    return df.rename(columns={
-        "date":"Date","description":"Description","category":"Category","vendor":"Vendor",
-        "phone":"Phone","amount_kes":"Amount (KES)","mode":"Mode","remarks":"Remarks"
-    })
-
-def fetch_rates():
-    df = _read_sql("SELECT rate_category, amount FROM public.rates ORDER BY rate_category")
-    return df.rename(columns={"rate_category":"Rate Category","amount":"Amount"})
+    """, conn=conn)
+    return df.rename(columns=_EXPENSE_RENAME)
 
-def fetch_expense_requests():
-    df = _read_sql("""
-        SELECT id, date, description, category, requested_by, amount_kes, status, remarks
-        FROM public.expense_requests
-        ORDER BY date DESC, id DESC
-    """)
-    return df.rename(columns={
-        "date":"Date","description":"Description","category":"Category","requested_by":"Requested By",
-        "amount_kes":"Amount (KES)","status":"Status","remarks":"Remarks"
-    })
-
-def fetch_contribution_requests():
-    df = _read_sql("""
-        SELECT id, date, month, family_name, house_no, lane, rate_category, amount_kes, status, remarks
-        FROM public.contribution_requests
-        ORDER BY date DESC, id DESC
-    """)
-    return df.rename(columns={
-        "date":"Date","month":"Month","family_name":"Family Name","house_no":"House No","lane":"Lane",
-        "rate_category":"Rate Category","amount_kes":"Amount (KES)","status":"Status","remarks":"Remarks"
-    })
-
-def fetch_special():
+def fetch_special(conn=None):
     df = _read_sql("""
         SELECT id, event, date, type, contributors, amount, remarks
         FROM public.special
         ORDER BY date DESC, id DESC
-    """)
-    return df.rename(columns={
-        "event":"Event","date":"Date","type":"Type","contributors":"Contributors",
-        "amount":"Amount","remarks":"Remarks"
-    })
-
-def fetch_special_requests():
-    df = _read_sql("""
-        SELECT id, date, event, type, requested_by, amount, status, remarks
-        FROM public.special_requests
-        ORDER BY date DESC, id DESC
-    """)
-    return df.rename(columns={
-        "date":"Date","requested_by":"Requested By",
-        "amount":"Amount","status":"Status","event":"Event","type":"Type"
-    })
-
-def fetch_cash_management():
-    df = _read_sql("""
-        SELECT cash_balance_cd, cash_withdrawal
-        FROM public.cash_management
-        ORDER BY updated_at DESC NULLS LAST
-        LIMIT 1
-    """)
-    if df.empty:
-        return pd.DataFrame({"Cash Balance c/d":[0],"Cash Withdrawal":[0]})
-    return df.rename(columns={
-        "cash_balance_cd":"Cash Balance c/d",
-        "cash_withdrawal":"Cash Withdrawal"
-    })
+    """, conn=conn)
+    return df.rename(columns=_SPECIAL_RENAME)
+
+# rates, the *_requests tables and the cash snapshot are small: fetch them as one JSON document.
+# Each entry: (payload key, columns, rename, date columns).
+_SMALL_TABLES = (
+    ("rates", ["rate_category", "amount"], _RATES_RENAME, ()),
+    ("expense_requests",
+     ["id", "date", "description", "category", "requested_by", "amount_kes", "status", "remarks"],
+     _EXPENSE_REQ_RENAME, ("date",)),
+    ("contribution_requests",
+     ["id", "date", "month", "family_name", "house_no", "lane", "rate_category", "amount_kes", "status", "remarks"],
+     _CONTRIB_REQ_RENAME, ("date",)),
+    ("special_requests",
+     ["id", "date", "event", "type", "requested_by", "amount", "status", "remarks"],
+     _SPECIAL_REQ_RENAME, ("date",)),
+)
+_SMALL_TABLES_SQL = """
+    SELECT json_build_object(
+        'rates', (SELECT COALESCE(json_agg(t), '[]'::json)
+                    FROM (SELECT {rates} FROM public.rates) t),
+        'expense_requests', (SELECT COALESCE(json_agg(t ORDER BY t.date DESC, t.id DESC), '[]'::json)
+                    FROM (SELECT {expense_requests} FROM public.expense_requests) t),
+        'contribution_requests', (SELECT COALESCE(json_agg(t ORDER BY t.date DESC, t.id DESC), '[]'::json)
+                    FROM (SELECT {contribution_requests} FROM public.contribution_requests) t),
+        'special_requests', (SELECT COALESCE(json_agg(t ORDER BY t.date DESC, t.id DESC), '[]'::json)
+                    FROM (SELECT {special_requests} FROM public.special_requests) t),
+        'cash_management', (SELECT row_to_json(t)
+                    FROM (SELECT cash_balance_cd, cash_withdrawal FROM public.cash_management
+                          ORDER BY updated_at DESC NULLS LAST LIMIT 1) t)
+    )
+""".format(**{key: ", ".join(cols) for key, cols, _, _ in _SMALL_TABLES})
+
+def fetch_small_tables(conn=None):
+    """rates, the three *_requests tables and the latest cash snapshot in one round trip, renamed for the dashboard."""
+    if conn is None:
+        with _connect() as conn:
+            return fetch_small_tables(conn)
+    payload = conn.execute(text(_SMALL_TABLES_SQL)).scalar_one()
+    if isinstance(payload, str):
+        payload = json.loads(payload)
+    out = {}
+    for key, cols, rename, date_cols in _SMALL_TABLES:
+        df = pd.DataFrame(payload[key], columns=cols)
+        for c in date_cols:
+            # JSON carries dates as ISO strings; match read_sql's datetime.date values, None for NULL
+            parsed = pd.to_datetime(df[c])
+            df[c] = parsed.dt.date.astype(object).where(parsed.notna(), None)
+        out[key] = df.rename(columns=rename)
+    # a handful of rows: cheaper to order here than to have the server sort
+    out["rates"] = out["rates"].sort_values("Rate Category", ignore_index=True)
+    cash = payload["cash_management"]
+    if cash is None:
+        out["cash_management"] = pd.DataFrame({"Cash Balance c/d":[0],"Cash Withdrawal":[0]})
+    else:
+        out["cash_management"] = pd.DataFrame([cash]).rename(columns=_CASH_RENAME)
+    return out
 
 def load_all():
-    return {
-        "contributions": fetch_contributions(),
-        "expenses": fetch_expenses(),
-        "special": fetch_special(),
-        "rates": fetch_rates(),
-        "expense_requests": fetch_expense_requests(),
-        "contribution_requests": fetch_contribution_requests(),
-        "special_requests": fetch_special_requests(),
-        "cash_management": fetch_cash_management(),
-    }
+    # One pooled checkout; the three ledgers are read on their own, the small tables in one round trip
+    with _connect() as conn:
+        small = fetch_small_tables(conn)
+        return {
+            "contributions": fetch_contributions(conn),
+            "expenses": fetch_expenses(conn),
+            "special": fetch_special(conn),
+            "rates": small["rates"],
+            "expense_requests": small["expense_requests"],
+            "contribution_requests": small["contribution_requests"],
+            "special_requests": small["special_requests"],
+            "cash_management": small["cash_management"],
+        }
 
 # ---------------------------------------------------------------------
 # WRITE helpers
@@ -274,29 +412,42 @@ def insert_contribution_request(date, month, family_name, house_no, lane, rate_c
         "lane": lane, "rate_category": rate_category, "amount_kes": amount_kes, "remarks": remarks
     })
 
-def approve_contribution_request(req_row, action, approval_remarks, current_month):
-    rid = req_row["id"] if "id" in req_row else req_row.name
-    _exec("""
+# Month columns of public.contributions; the only identifiers ever spliced into SQL text
+_MONTHS = ("jan","feb","mar","apr","may","jun","jul","aug","sep","oct","nov","dec")
+
+_MARK_CONTRIB_REQUEST = """
         UPDATE public.contribution_requests
-           SET status = %(status)s, remarks = CONCAT(%(remarks)s, ' | ', COALESCE(remarks,'')) 
+           SET status = %(status)s, remarks = CONCAT(%(remarks)s, ' | ', COALESCE(remarks,''))
          WHERE id = %(id)s
-    """, {"status": action, "remarks": approval_remarks, "id": rid})
+    """
+# One statement per month, built once: mark the request and post the payment together
+_APPROVE_STMTS: dict[str, str] = {
+    m: f"""
+        WITH marked AS ({_MARK_CONTRIB_REQUEST})
+        UPDATE public.contributions
+           SET {m} = %(amount)s,
+               updated_at = NOW()
+         WHERE family_name = %(family_name)s
+    """
+    for m in _MONTHS
+}
 
+def approve_contribution_request(req_row, action, approval_remarks, current_month):
+    rid = req_row["id"] if "id" in req_row else req_row.name
+    params = {"status": action, "remarks": approval_remarks, "id": rid}
     if action != "Approve":
+        _exec(_MARK_CONTRIB_REQUEST, params)
         return
 
-    month_col = current_month.lower()  # 'JAN' -> 'jan'
-    _exec(f"""
-        UPDATE public.contributions
-           SET {month_col} = %(amount)s,
-               ytd = COALESCE(jan,0)+COALESCE(feb,0)+COALESCE(mar,0)+COALESCE(apr,0)+COALESCE(may,0)+COALESCE(jun,0)
-                   +COALESCE(jul,0)+COALESCE(aug,0)+COALESCE(sep,0)+COALESCE(oct,0)+COALESCE(nov,0)+COALESCE(dec,0),
-               updated_at = NOW()
-         WHERE family_name = %(family_name)s
-    """, {
+    month_col = str(current_month).strip().lower()  # 'JAN' -> 'jan'
+    if month_col not in _MONTHS:
+        raise ValueError(f"Unknown contribution month: {current_month!r}")
+    _ensure_ytd_trigger()
+    params.update({
         "amount": req_row.get("Amount (KES)", req_row.get("amount_kes")),
         "family_name": req_row.get("Family Name", req_row.get("family_name")),
     })
+    _exec(_APPROVE_STMTS[month_col], params)
 
 def insert_expense(date, description, category, vendor, phone, amount_kes, mode, remarks):
     _exec("""
@@ -333,27 +484,72 @@ def update_cash_management(cash_balance_cd, cash_withdrawal):
     """, {"a": cash_balance_cd, "b": cash_withdrawal})
 
 def upsert_rates(df_rates):
-    for _, r in df_rates.iterrows():
-        _exec("""
+    # Keyed by category so a repeated category keeps its last amount (one row per conflict target)
+    rows = dict(zip(df_rates["Rate Category"].tolist(), df_rates["Amount"].astype(float).tolist()))
+    if not rows:
+        return
+    with _conn() as conn, conn.cursor() as cur:
+        execute_values(cur, """
             INSERT INTO public.rates (rate_category, amount)
-            VALUES (%(cat)s, %(amt)s)
+            VALUES %s
             ON CONFLICT (rate_category) DO UPDATE SET amount = EXCLUDED.amount
-        """, {"cat": r["Rate Category"], "amt": float(r["Amount"])})
+        """, list(rows.items()), page_size=500)
+
+def _household_copy_buffer(df_households):
+    """
+    Rows (house_no, rate_category, email) for the COPY in update_household_rate_email, or None if empty.
+    Last edit wins for a repeated House No, as with the old row-by-row updates.
+    """
+    emails = df_households["Email"].tolist() if "Email" in df_households.columns else [""] * len(df_households)
+    rows = {
+        hn: (rc, em)
+        for hn, rc, em in zip(
+            df_households["House No"].astype(str).tolist(),
+            df_households["Rate Category"].tolist(),
+            emails,
+        )
+    }
+    if not rows:
+        return None
+    # COPY text format: tab-separated, \N for NULL. Missing values (NaN under pandas 3, or None) become NULL,
+    # while '' stays an empty string.
+    def field(v):
+        if v is None or pd.isna(v):
+            return "\\N"
+        return str(v).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+    buf = io.StringIO()
+    buf.writelines(
+        f"{field(hn)}\t{field(rc)}\t{field(em)}\n"
+        for hn, (rc, em) in rows.items()
+    )
+    buf.seek(0)
+    return buf
 
 def update_household_rate_email(df_households):
-    for _, r in df_households.iterrows():
-        _exec("""
-            UPDATE public.contributions
-               SET rate_category = %(rc)s, email = %(em)s
-             WHERE house_no = %(hn)s
-        """, {"rc": r["Rate Category"], "em": r.get("Email",""), "hn": str(r["House No"])})
+    buf = _household_copy_buffer(df_households)
+    if buf is None:
+        return
+    # Stream the rows over COPY into a temp table, then apply them with one UPDATE
+    with _conn() as conn:
+        # ON COMMIT DROP needs a real transaction; the pool hands out autocommit connections
+        conn.autocommit = False
+        with conn.cursor() as cur:
+            cur.execute("CREATE TEMP TABLE _hh_stage (hn TEXT, rc TEXT, em TEXT) ON COMMIT DROP")
+            cur.copy_expert("COPY _hh_stage FROM STDIN", buf)
+            cur.execute("""
+                UPDATE public.contributions AS c
+                   SET rate_category = s.rc, email = s.em
+                  FROM _hh_stage AS s
+                 WHERE c.house_no = s.hn
+            """)
+        conn.commit()
 
 # ---------------------------------------------------------------------
 # Special contributions (schema guard + writes)
 # ---------------------------------------------------------------------
 def insert_special_request(date, event, type, requested_by, amount, remarks):
-    _ensure_special_tables()
-    _exec("""
+    _special_exec("""
         INSERT INTO public.special_requests
             (date, event, type, requested_by, amount, status, remarks)
         VALUES (%(date)s, %(event)s, %(type)s, %(requested_by)s, %(amount)s, 'Pending Approval', %(remarks)s)
@@ -363,8 +559,7 @@ def insert_special_request(date, event, type, requested_by, amount, remarks):
     })
 
 def set_special_request_status(request_id, status, approval_remarks):
-    _ensure_special_tables()
-    _exec("""
+    _special_exec("""
         UPDATE public.special_requests
            SET status = %(status)s,
                remarks = CONCAT(%(remarks)s, ' | ', COALESCE(remarks,''))
@@ -372,8 +567,7 @@ def set_special_request_status(request_id, status, approval_remarks):
     """, {"status": status, "remarks": approval_remarks, "id": int(request_id)})
 
 def insert_special(date, event, type, contributors, amount, remarks):
-    _ensure_special_tables()
-    _exec("""
+    _special_exec("""
         INSERT INTO public.special
             (date, event, type, contributors, amount, remarks)
         VALUES (%(date)s, %(event)s, %(type)s, %(contributors)s, %(amount)s, %(remarks)s)
@@ -382,7 +576,26 @@ def insert_special(date, event, type, contributors, amount, remarks):
         "contributors": contributors, "amount": amount, "remarks": remarks
     })
 
+_SPECIAL_TABLES_READY = False
+
+def _special_exec(sql, params):
+    """_exec for the special tables, re-running the guard once if they were dropped since it ran."""
+    global _SPECIAL_TABLES_READY
+    _ensure_special_tables()
+    try:
+        return _exec(sql, params)
+    except RuntimeError as e:
+        if not isinstance(e.__cause__, psycopg2.errors.UndefinedTable):
+            raise
+        _SPECIAL_TABLES_READY = False
+        _ensure_special_tables()
+        return _exec(sql, params)
+
 def _ensure_special_tables():
+    """CREATE TABLE IF NOT EXISTS for special/special_requests, once per process."""
+    global _SPECIAL_TABLES_READY
+    if _SPECIAL_TABLES_READY:
+        return
     with _conn() as conn:
         with conn.cursor() as cur:
             cur.execute("""
@@ -409,6 +622,44 @@ def _ensure_special_tables():
                 );
             """)
         # conn.autocommit=True already; explicit commit not required
+    _SPECIAL_TABLES_READY = True
+
+# ---------------------------------------------------------------------
+# Contributions YTD (schema guard)
+# ---------------------------------------------------------------------
+_YTD_TRIGGER_READY = False
+
+def _ensure_ytd_trigger():
+    """
+    Keep contributions.ytd equal to the sum of the month columns on every insert/update,
+    so writers only send the months they change. The trigger always overwrites NEW.ytd:
+    an explicit ytd (e.g. from the legacy CSV import) is replaced by the month sum.
+    init_db.py and db/schema.sql install the same trigger; this covers databases created
+    before that, and runs its DDL once per process (later calls return on the flag).
+    """
+    global _YTD_TRIGGER_READY
+    if _YTD_TRIGGER_READY:
+        return
+    with _conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                CREATE OR REPLACE FUNCTION public.contributions_set_ytd() RETURNS trigger
+                LANGUAGE plpgsql AS $$
+                BEGIN
+                    NEW.ytd := COALESCE(NEW.jan,0)+COALESCE(NEW.feb,0)+COALESCE(NEW.mar,0)
+                             +COALESCE(NEW.apr,0)+COALESCE(NEW.may,0)+COALESCE(NEW.jun,0)
+                             +COALESCE(NEW.jul,0)+COALESCE(NEW.aug,0)+COALESCE(NEW.sep,0)
+                             +COALESCE(NEW.oct,0)+COALESCE(NEW.nov,0)+COALESCE(NEW.dec,0);
+                    RETURN NEW;
+                END
+                $$;
+            """)
+            cur.execute("""
+                CREATE OR REPLACE TRIGGER contributions_set_ytd
+                BEFORE INSERT OR UPDATE ON public.contributions
+                FOR EACH ROW EXECUTE FUNCTION public.contributions_set_ytd();
+            """)
+    _YTD_TRIGGER_READY = True
 
 # ---------------------------------------------------------------------
 # Admin: edit / delete helpers (Treasurer tools)
@@ -437,10 +688,7 @@ def update_contribution_row(
         except Exception:
             return None
 
-    month_map = {
-        "JAN": "jan","FEB": "feb","MAR": "mar","APR": "apr","MAY": "may","JUN": "jun",
-        "JUL": "jul","AUG": "aug","SEP": "sep","OCT": "oct","NOV": "nov","DEC": "dec",
-    }
+    month_map = {m.upper(): m for m in _MONTHS}
     sets = []
     params = {"house_no": str(house_no)}
 
@@ -474,11 +722,8 @@ def update_contribution_row(
                 sets.append(f"{col} = %({col})s")
                 params[col] = _num_or_none(v)
 
-    # Always recompute YTD + timestamp when we touch the row
-    sets.append("""
-        ytd = COALESCE(jan,0)+COALESCE(feb,0)+COALESCE(mar,0)+COALESCE(apr,0)+COALESCE(may,0)+COALESCE(jun,0)
-            +COALESCE(jul,0)+COALESCE(aug,0)+COALESCE(sep,0)+COALESCE(oct,0)+COALESCE(nov,0)+COALESCE(dec,0)
-    """)
+    # YTD is recomputed by the contributions_set_ytd trigger; just stamp the row
+    _ensure_ytd_trigger()
     sets.append("updated_at = NOW()")
 
     if not sets: